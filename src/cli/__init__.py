@@ -1,3 +1,3 @@
-from .arguments import create_parser, validate_args
+from .arguments import create_parser, parse_args_fast, validate_args
 
-__all__ = ['create_parser', 'validate_args']
+__all__ = ['create_parser', 'parse_args_fast', 'validate_args']
@@ -1,6 +1,47 @@
 import argparse
+import sys
 from pathlib import Path
-from typing import Any
+from types import SimpleNamespace
+from typing import Any, Optional
+
+# Defaults compartilhados entre o parser completo e o fast-path sem argparse
+ARGUMENT_DEFAULTS = {
+    'output_dir': None,
+    'model': 'unicamp-dl/ptt5-base-portuguese-vocab',
+    'no_summary': False,
+    'no_images': False,
+    'report': None,
+    'no_report': False,
+    'no_cache': False,
+    'force': False,
+    'verbose': False,
+    'quiet': False,
+    'word_mode': 'text',
+    'keep_numbers': False,
+    'top_n_words': 10,
+    'no_structure': False,
+    'max_pages': None,
+    'min_image_size': 100,
+    'deterministic': False,
+    'log': True,
+}
+
+
+def parse_args_fast() -> Optional[Any]:
+    """Atalho para a invocação comum `python -m src.main arquivo.pdf`.
+
+    Evita construir o ArgumentParser completo (~15 argumentos) quando só o
+    caminho do PDF foi passado, cortando alguns ms do startup.
+
+    Returns:
+        Namespace com os defaults preenchidos, ou None se a linha de comando
+        exigir o parser completo
+    """
+    argv = sys.argv[1:]
+    if len(argv) != 1 or argv[0].startswith('-') or not argv[0].lower().endswith('.pdf'):
+        return None
+
+    return SimpleNamespace(pdf_file=argv[0], **ARGUMENT_DEFAULTS)
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -55,6 +96,24 @@ Exemplos de uso:
         help='Gera relatório completo em Markdown (padrão: outputs/relatorio_<nome-pdf>.md se não especificado)'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignora o cache de análises em disco e reanalisa o PDF'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Reprocessa mesmo que uma execução idêntica já tenha gerado relatório'
+    )
+
+    parser.add_argument(
+        '--no-report',
+        action='store_true',
+        help='Desabilita a geração do relatório Markdown (útil em lote)'
+    )
+
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -118,14 +177,16 @@ Exemplos de uso:
     )
     
     # Configuração de logs
-    parser.set_defaults(log=True)
     parser.add_argument(
         '--no-log-file',
         dest='log',
         action='store_false',
         help='Desabilita o registro de logs em arquivo (mantém apenas console)'
     )
-    
+
+    # Mantém o parser completo e o fast-path com os mesmos defaults
+    parser.set_defaults(**ARGUMENT_DEFAULTS)
+
     return parser
 
 
@@ -139,20 +200,29 @@ def validate_args(args: Any) -> bool:
         True se argumentos são válidos, False caso contrário
     """
     pdf_path = Path(args.pdf_file)
-    
-    if not pdf_path.exists():
+
+    # Um único stat cobre a checagem de existência (evita exists() + uso
+    # posterior); OSError também apanha caminhos inválidos ou sem permissão
+    try:
+        pdf_path.stat()
+    except OSError:
         print(f"[ERRO] Arquivo não encontrado: {args.pdf_file}")
         print(f"[INFO] Verifique o caminho e tente novamente")
         return False
-    
-    if not pdf_path.suffix.lower() == '.pdf':
+
+    suffix = pdf_path.suffix
+    if suffix.lower() != '.pdf':
         print(f"[ERRO] O arquivo deve ser um PDF: {args.pdf_file}")
-        print(f"[INFO] Extensão detectada: {pdf_path.suffix}")
+        print(f"[INFO] Extensão detectada: {suffix}")
         return False
     
     if args.verbose and args.quiet:
         print("[ERRO] As opções --verbose e --quiet são mutuamente exclusivas")
         return False
+
+    if args.report and args.no_report:
+        print("[ERRO] As opções --report e --no-report são mutuamente exclusivas")
+        return False
     
     if args.top_n_words < 1:
         print(f"[ERRO] --top-n-words deve ser pelo menos 1, recebido: {args.top_n_words}")
@@ -167,13 +237,12 @@ def validate_args(args: Any) -> bool:
         return False
     
     if args.report:
+        # mkdir com exist_ok já cobre o caso de diretório existente, sem stat prévio
         report_dir = Path(args.report).parent
-        if not report_dir.exists():
-            try:
-                report_dir.mkdir(parents=True, exist_ok=True)
-                print(f"[INFO] Diretório criado para relatório: {report_dir}")
-            except Exception as error:
-                print(f"[ERRO] Não foi possível criar diretório para relatório: {error}")
-                return False
+        try:
+            report_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as error:
+            print(f"[ERRO] Não foi possível criar diretório para relatório: {error}")
+            return False
     
     return True
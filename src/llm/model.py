@@ -1,39 +1,136 @@
 import logging
-from typing import Optional
-import torch
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+from typing import Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Cache de modelos carregados por nome, para reutilizar pesos entre execuções
+_MODEL_CACHE: dict = {}
+
+# Cache de gerações já computadas, para pular o generate em conteúdo repetido
+_GENERATION_CACHE: dict = {}
+_GENERATION_CACHE_MAX_SIZE = 128
+
+
+def _generation_cache_key(model_name: str, prompt: str, max_length: int, min_length: int, deterministic: bool, num_beams: int) -> tuple:
+    import hashlib
+
+    digest = hashlib.blake2b(prompt.encode('utf-8')).hexdigest()
+    return (model_name, digest, max_length, min_length, deterministic, num_beams)
+
 
 class LLMModel:
-    
+
     def __init__(self, model_name: str = "unicamp-dl/ptt5-base-portuguese-vocab"):
+        # Import tardio: torch só é carregado quando o modelo é realmente usado
+        import torch
+
         self.model_name = model_name
+        # Nome pedido na construção: load() pode trocar model_name pelo
+        # fallback, mas o cache de instâncias indexa pelo nome solicitado
+        self._cache_key = model_name
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         logger.info(f"Usando dispositivo: {self.device}")
-        
-        self.tokenizer: Optional[AutoTokenizer] = None
-        self.model: Optional[AutoModelForSeq2SeqLM] = None
-    
+
+        self.tokenizer: Optional[Any] = None
+        self.model: Optional[Any] = None
+
+    @classmethod
+    def get_or_load(cls, model_name: str = "unicamp-dl/ptt5-base-portuguese-vocab") -> 'LLMModel':
+        """Retorna instância em cache do modelo, carregando apenas na primeira vez.
+
+        Args:
+            model_name: Nome do modelo a carregar/reutilizar
+
+        Returns:
+            Instância de LLMModel com pesos já carregados
+        """
+        cached = _MODEL_CACHE.get(model_name)
+        if cached is not None:
+            logger.info(f"Reutilizando modelo em cache: {model_name}")
+            return cached
+
+        instance = cls(model_name)
+        instance.load()
+        _MODEL_CACHE[model_name] = instance
+        return instance
+
+    def _load_weights(self, model_name: str) -> None:
+        """Carrega tokenizer e pesos do modelo, usando FP16 em GPU.
+
+        Tenta primeiro o cache local do Hugging Face (sem rede) e só baixa
+        quando o modelo ainda não está em disco. Em GPU usa half precision e
+        device_map='auto' para reduzir memória; em CPU mantém FP32.
+        """
+        try:
+            self._load_from_hub(model_name, local_files_only=True)
+            logger.info(f"Modelo carregado do cache local: {model_name}")
+        except OSError:
+            logger.info(f"Modelo não encontrado no cache local, baixando: {model_name}")
+            self._load_from_hub(model_name, local_files_only=False)
+
+    def _load_from_hub(self, model_name: str, local_files_only: bool) -> None:
+        import torch
+        from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+
+        # use_fast garante o tokenizer Rust (~10x mais rápido que o SentencePiece puro)
+        self.tokenizer = AutoTokenizer.from_pretrained(
+            model_name,
+            use_fast=True,
+            local_files_only=local_files_only
+        )
+        if not getattr(self.tokenizer, "is_fast", False):
+            logger.warning(f"Tokenizer rápido indisponível para {model_name}, usando versão Python (mais lenta)")
+
+        if self.device == "cuda":
+            self.model = AutoModelForSeq2SeqLM.from_pretrained(
+                model_name,
+                torch_dtype=torch.float16,
+                low_cpu_mem_usage=True,
+                device_map="auto",
+                local_files_only=local_files_only
+            )
+        else:
+            self.model = AutoModelForSeq2SeqLM.from_pretrained(
+                model_name,
+                torch_dtype=torch.float32,
+                low_cpu_mem_usage=True,
+                local_files_only=local_files_only
+            )
+            self.model.to(self.device)
+
     def load(self) -> None:
         logger.info(f"Carregando modelo: {self.model_name}")
-        
+
         try:
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
-            self.model.to(self.device)
-            
+            self._load_weights(self.model_name)
             logger.info("Modelo carregado com sucesso")
         except Exception as e:
             logger.error(f"Erro ao carregar modelo: {e}")
             logger.info("Tentando modelo alternativo: google/flan-t5-small")
             self.model_name = "google/flan-t5-small"
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
-            self.model.to(self.device)
+            self._load_weights(self.model_name)
+
+        self._maybe_compile()
+
+    def _maybe_compile(self) -> None:
+        """Compila o modelo com torch.compile em GPU (PyTorch 2.0+).
+
+        O custo único de compilação amortiza nas execuções seguintes graças
+        ao cache de modelos por processo; em caso de erro mantém o modelo
+        sem compilar.
+        """
+        import torch
+
+        if self.device != "cuda" or not hasattr(torch, "compile"):
+            return
+
+        try:
+            self.model = torch.compile(self.model, mode="reduce-overhead", fullgraph=False)
+            logger.info("Modelo compilado com torch.compile")
+        except Exception as error:
+            logger.warning(f"torch.compile indisponível, usando modelo sem compilar: {error}")
     
-    def generate_text(self, prompt: str, max_length: int = 512, min_length: int = 50, deterministic: bool = False) -> str:
+    def generate_text(self, prompt: str, max_length: int = 512, min_length: int = 50, deterministic: bool = False, num_beams: int = 4) -> str:
         """Gera texto a partir de um prompt.
         
         Args:
@@ -41,52 +138,189 @@ class LLMModel:
             max_length: Comprimento máximo do texto gerado
             min_length: Comprimento mínimo do texto gerado
             deterministic: Se True, desabilita amostragem aleatória para reprodutibilidade
+            num_beams: Largura do beam search (menor = mais rápido)
         
         Returns:
             Texto gerado pelo modelo
         """
+        import torch
+
         if not self.model or not self.tokenizer:
             raise RuntimeError("Modelo não carregado. Chame load() primeiro.")
-        
+
+        cache_key = _generation_cache_key(self.model_name, prompt, max_length, min_length, deterministic, num_beams)
+        cached = _GENERATION_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug("Resumo encontrado em cache, pulando geração")
+            return cached
+
         logger.debug(f"Gerando texto para prompt de {len(prompt)} caracteres")
-        
+
+        # Sem padding: com um único prompt não há batch para alinhar
         inputs = self.tokenizer(
             prompt,
             return_tensors="pt",
             max_length=512,
-            truncation=True,
-            padding=True
-        ).to(self.device)
-        
+            truncation=True
+        )
+
+        # Passa apenas os tensores necessários ao generate; non_blocking permite
+        # sobrepor a cópia host->device com o trabalho Python seguinte
+        input_ids = inputs["input_ids"].to(self.device, non_blocking=True)
+        attention_mask = inputs["attention_mask"].to(self.device, non_blocking=True)
+
         generation_kwargs = {
             "max_length": max_length,
             "min_length": min_length,
-            "num_beams": 4,
+            "num_beams": num_beams,
             "early_stopping": True,
-            "no_repeat_ngram_size": 3
+            "no_repeat_ngram_size": 3,
+            "use_cache": True,
+            "length_penalty": 1.0
         }
-        
+
         if deterministic:
             generation_kwargs["do_sample"] = False
             generation_kwargs["temperature"] = None
-        
-        with torch.no_grad():
-            outputs = self.model.generate(**inputs, **generation_kwargs)
-        
+
+        with torch.inference_mode():
+            outputs = self.model.generate(
+                input_ids=input_ids,
+                attention_mask=attention_mask,
+                **generation_kwargs
+            )
+
         generated_text = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
         logger.debug(f"Texto gerado: {len(generated_text)} caracteres")
-        
+
+        if len(_GENERATION_CACHE) >= _GENERATION_CACHE_MAX_SIZE:
+            _GENERATION_CACHE.pop(next(iter(_GENERATION_CACHE)))
+        _GENERATION_CACHE[cache_key] = generated_text
+
         return generated_text
-    
-    def unload(self) -> None:
+
+    def count_tokens(self, text: str) -> int:
+        """Conta tokens do texto sem alocar tensores.
+
+        Args:
+            text: Texto a medir
+
+        Returns:
+            Número de tokens segundo o tokenizer do modelo
+        """
+        if not self.tokenizer:
+            raise RuntimeError("Modelo não carregado. Chame load() primeiro.")
+
+        return len(self.tokenizer(text, add_special_tokens=False)["input_ids"])
+
+    def generate_from_ids(self, input_ids: Any, attention_mask: Any, max_length: int = 512, min_length: int = 50, deterministic: bool = False, num_beams: int = 4) -> List[str]:
+        """Gera texto a partir de tensores já tokenizados, sem re-tokenizar.
+
+        Permite tokenizar os prompts uma única vez no chamador e reusar
+        os tensores em chamadas ao generate.
+
+        Args:
+            input_ids: Tensor de ids já no dispositivo do modelo
+            attention_mask: Máscara de atenção correspondente
+            max_length: Comprimento máximo de cada texto gerado
+            min_length: Comprimento mínimo de cada texto gerado
+            deterministic: Se True, desabilita amostragem aleatória para reprodutibilidade
+            num_beams: Largura do beam search (menor = mais rápido)
+
+        Returns:
+            Lista de textos gerados, um por sequência de entrada
+        """
+        import torch
+
+        if not self.model or not self.tokenizer:
+            raise RuntimeError("Modelo não carregado. Chame load() primeiro.")
+
+        generation_kwargs = {
+            "max_length": max_length,
+            "min_length": min_length,
+            "num_beams": num_beams,
+            "early_stopping": True,
+            "no_repeat_ngram_size": 3,
+            "use_cache": True,
+            "length_penalty": 1.0
+        }
+
+        if deterministic:
+            generation_kwargs["do_sample"] = False
+            generation_kwargs["temperature"] = None
+
+        with torch.inference_mode():
+            outputs = self.model.generate(
+                input_ids=input_ids,
+                attention_mask=attention_mask,
+                **generation_kwargs
+            )
+
+        return self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+
+    def generate_texts(self, prompts: List[str], max_length: int = 512, min_length: int = 50, deterministic: bool = False, num_beams: int = 4) -> List[str]:
+        """Gera texto para vários prompts em uma única chamada batched ao modelo.
+
+        Args:
+            prompts: Lista de textos de entrada para o modelo
+            max_length: Comprimento máximo de cada texto gerado
+            min_length: Comprimento mínimo de cada texto gerado
+            deterministic: Se True, desabilita amostragem aleatória para reprodutibilidade
+            num_beams: Largura do beam search (menor = mais rápido)
+
+        Returns:
+            Lista de textos gerados, na mesma ordem dos prompts
+        """
+        if not self.model or not self.tokenizer:
+            raise RuntimeError("Modelo não carregado. Chame load() primeiro.")
+
+        if not prompts:
+            return []
+
+        logger.debug(f"Gerando texto em batch para {len(prompts)} prompts")
+
+        # Tokeniza todos os prompts de uma só vez; generate_from_ids reusa os tensores
+        inputs = self.tokenizer(
+            prompts,
+            return_tensors="pt",
+            max_length=512,
+            truncation=True,
+            padding="longest"
+        ).to(self.device)
+
+        generated_texts = self.generate_from_ids(
+            inputs["input_ids"],
+            inputs["attention_mask"],
+            max_length=max_length,
+            min_length=min_length,
+            deterministic=deterministic,
+            num_beams=num_beams
+        )
+        logger.debug(f"Batch gerado: {len(generated_texts)} textos")
+
+        return generated_texts
+
+    def unload(self, explicit_release: bool = False) -> None:
+        """Descarrega o modelo da memória.
+
+        Args:
+            explicit_release: Se True, devolve a memória CUDA ao driver via
+                empty_cache(). A chamada é síncrona e lenta, então só vale a
+                pena quando outro processo precisa da VRAM.
+        """
+        _MODEL_CACHE.pop(self._cache_key, None)
+
         if self.model:
             del self.model
             self.model = None
         if self.tokenizer:
             del self.tokenizer
             self.tokenizer = None
-        
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-        
+
+        if explicit_release:
+            import torch
+
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+
         logger.info("Modelo descarregado")
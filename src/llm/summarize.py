@@ -1,16 +1,18 @@
 import logging
-from typing import List
-from .model import LLMModel
-from ..utils.text import split_into_chunks
+from itertools import islice
+from typing import Iterable, List
+from ..utils.text import split_into_chunks_iter, split_stream_into_chunks
 
 logger = logging.getLogger(__name__)
 
 
 class Summarizer:
-    
+
     def __init__(self, model_name: str = "unicamp-dl/ptt5-base-portuguese-vocab"):
-        self.model = LLMModel(model_name)
-        self.model.load()
+        # Import tardio: torch/transformers só são carregados quando o resumo é usado
+        from .model import LLMModel
+
+        self.model = LLMModel.get_or_load(model_name)
     
     def summarize(self, text: str, max_summary_length: int = 500, deterministic: bool = False) -> str:
         """Gera resumo do texto usando LLM.
@@ -29,51 +31,135 @@ class Summarizer:
         logger.info("Gerando resumo do texto...")
         logger.info(f"Modelo: {self.model.model_name} | Dispositivo: {self.model.device}")
         
-        if len(text) > 3000:
+        # Decide o chunking por tokens reais, não por caracteres: textos curtos
+        # em tokens cabem numa única passada mesmo com mais de 3000 caracteres
+        n_tokens = self.model.count_tokens(text)
+        logger.debug(f"Texto com {n_tokens} tokens")
+
+        if n_tokens > 450:
             logger.info("Texto longo detectado, dividindo em chunks...")
-            chunks = split_into_chunks(text, max_length=1000)
-            
-            chunk_summaries = []
-            for i, chunk in enumerate(chunks[:5]):
-                logger.info(f"Resumindo chunk {i+1}/{min(len(chunks), 5)}")
-                prompt = (
+            # Gera só os 5 primeiros chunks sob demanda, sem materializar o resto
+            prompts = [
+                (
                     f"Resuma o seguinte texto em português de forma clara e objetiva, "
                     f"focando nos pontos principais e conclusões:\n\n{chunk}"
                 )
-                summary = self.model.generate_text(
-                    prompt, 
-                    max_length=200, 
-                    min_length=30,
+                for chunk in islice(split_into_chunks_iter(text, max_length=1000), 5)
+            ]
+            del text
+            logger.info(f"Resumindo {len(prompts)} chunks em batch")
+            chunk_summaries = self.model.generate_texts(
+                prompts,
+                max_length=200,
+                min_length=30,
+                deterministic=deterministic,
+                num_beams=2
+            )
+            
+            if len(chunk_summaries) == 1:
+                # Um único chunk: a passada de consolidação não agrega informação
+                logger.info("Apenas um chunk resumido, pulando consolidação")
+                final_summary = chunk_summaries[0]
+            else:
+                combined = " ".join(chunk_summaries)
+                prompt = (
+                    f"Faça um resumo consolidado em até 3 parágrafos do seguinte conteúdo, "
+                    f"mantendo as informações mais relevantes:\n\n{combined}"
+                )
+                final_summary = self.model.generate_text(
+                    prompt,
+                    max_length=max_summary_length,
+                    min_length=100,
                     deterministic=deterministic
                 )
-                chunk_summaries.append(summary)
-            
-            combined = " ".join(chunk_summaries)
+        else:
             prompt = (
-                f"Faça um resumo consolidado em até 3 parágrafos do seguinte conteúdo, "
-                f"mantendo as informações mais relevantes:\n\n{combined}"
+                f"Resuma o seguinte texto em português de forma clara para um público geral, "
+                f"enfatizando objetivos, metodologia e conclusões principais:\n\n{text[:2000]}"
             )
             final_summary = self.model.generate_text(
                 prompt, 
                 max_length=max_summary_length, 
-                min_length=100,
+                min_length=50,
                 deterministic=deterministic
             )
-        else:
+        
+        elapsed_time = time.time() - start_time
+        logger.info(f"Resumo gerado com sucesso em {elapsed_time:.2f}s")
+        return final_summary
+    
+    def summarize_iter(self, pieces: Iterable[str], max_summary_length: int = 500, deterministic: bool = False) -> str:
+        """Gera resumo a partir de um fluxo de trechos de texto (ex: páginas de PDF).
+
+        Os trechos são divididos em chunks sob demanda, sem concatenar o
+        documento inteiro em memória.
+
+        Args:
+            pieces: Iterável de trechos de texto na ordem do documento
+            max_summary_length: Tamanho máximo do resumo
+            deterministic: Se True, gera resumos reproduzíveis
+
+        Returns:
+            Texto do resumo gerado
+        """
+        import time
+        start_time = time.time()
+
+        logger.info("Gerando resumo em streaming...")
+        logger.info(f"Modelo: {self.model.model_name} | Dispositivo: {self.model.device}")
+
+        # Consome o fluxo só até os 5 primeiros chunks, como no caminho em memória
+        chunks = list(islice(split_stream_into_chunks(pieces, max_length=1000), 5))
+
+        if not chunks:
+            logger.warning("Nenhum texto recebido para resumir")
+            return ""
+
+        if len(chunks) == 1:
             prompt = (
                 f"Resuma o seguinte texto em português de forma clara para um público geral, "
-                f"enfatizando objetivos, metodologia e conclusões principais:\n\n{text[:2000]}"
+                f"enfatizando objetivos, metodologia e conclusões principais:\n\n{chunks[0][:2000]}"
             )
             final_summary = self.model.generate_text(
-                prompt, 
-                max_length=max_summary_length, 
+                prompt,
+                max_length=max_summary_length,
                 min_length=50,
                 deterministic=deterministic
             )
-        
+        else:
+            prompts = [
+                (
+                    f"Resuma o seguinte texto em português de forma clara e objetiva, "
+                    f"focando nos pontos principais e conclusões:\n\n{chunk}"
+                )
+                for chunk in chunks
+            ]
+            del chunks
+            logger.info(f"Resumindo {len(prompts)} chunks em batch")
+            chunk_summaries = self.model.generate_texts(
+                prompts,
+                max_length=200,
+                min_length=30,
+                deterministic=deterministic,
+                num_beams=2
+            )
+
+            combined = " ".join(chunk_summaries)
+            prompt = (
+                f"Faça um resumo consolidado em até 3 parágrafos do seguinte conteúdo, "
+                f"mantendo as informações mais relevantes:\n\n{combined}"
+            )
+            final_summary = self.model.generate_text(
+                prompt,
+                max_length=max_summary_length,
+                min_length=100,
+                deterministic=deterministic
+            )
+
         elapsed_time = time.time() - start_time
         logger.info(f"Resumo gerado com sucesso em {elapsed_time:.2f}s")
         return final_summary
-    
+
     def cleanup(self) -> None:
-        self.model.unload()
+        """Mantém o modelo em cache para reuso; os pesos só são liberados via unload()."""
+        logger.debug("Modelo mantido em cache para próximas execuções")
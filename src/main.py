@@ -1,14 +1,57 @@
+import os
 import sys
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from datetime import datetime
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
-from .cli.arguments import create_parser, validate_args
-from .pdf.extractor import PDFExtractor
-from .pdf.images import ImageExtractor
-from .llm.summarize import Summarizer
+from .cli.arguments import create_parser, parse_args_fast, validate_args
 from .utils.files import format_bytes, ensure_directory
+from .utils.cache import make_cache_key, cache_get, cache_put
+
+# Separador e cabeçalhos pré-computados uma única vez no import
+_SEP = "=" * 70
+_HEADER_ANALYSIS = f"\n{_SEP}\nANÁLISE DO PDF\n{_SEP}"
+_HEADER_IMAGES = f"{_SEP}\nEXTRAÇÃO DE IMAGENS\n{_SEP}"
+_HEADER_SUMMARY = f"{_SEP}\nRESUMO DO DOCUMENTO (gerado por LLM)\n{_SEP}"
+
+# Boilerplate estático dos relatórios Markdown: alocado uma vez no import,
+# em vez de uma string nova a cada relatório gerado
+_MD_TITLE = "# 📊 Relatório Completo de Análise de PDF\n\n"
+_MD_RULE = "---\n\n"
+_MD_DOC_INFO = "## 📄 Informações do Documento\n\n"
+_MD_COMMON_WORDS = "## 🔤 Palavras Mais Comuns\n\n| # | Palavra | Frequência |\n|---|---------|------------|\n"
+_MD_TITLES = "## 📑 Títulos Detectados\n\n"
+_MD_SECTIONS = "## 📋 Seções Identificadas\n\n"
+_MD_KEYWORDS = "## 🔑 Palavras-Chave Principais\n\n"
+_MD_IMAGES = "## 🖼️ Imagens Extraídas\n\n"
+_MD_IMAGE_LIST = "### Lista de Imagens\n\n"
+_MD_SUMMARY = "## 📝 Resumo Gerado por LLM\n\n"
+_MD_TRAILER = _MD_RULE + "*Relatório gerado automaticamente pela ferramenta CLI de Análise de PDF*\n"
+_MD_TRAILER_LLM = _MD_RULE + "*Relatório gerado automaticamente pela ferramenta CLI de Análise de PDF com Sumarização por LLM*\n"
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler sem stat() por registro emitido.
+
+    O handler padrão consulta o filesystem a cada emit para decidir a
+    rotação; aqui usamos a posição do stream (tell) como checagem barata
+    e só caímos na verificação padrão quando a rotação está iminente.
+    """
+
+    def shouldRollover(self, record: logging.LogRecord) -> int:
+        if self.stream is None:
+            self.stream = self._open()
+
+        if self.maxBytes > 0:
+            if self.stream.tell() + len(self.format(record)) + 1 < self.maxBytes:
+                return 0
+            return super().shouldRollover(record)
+
+        return 0
 
 
 def setup_logging(verbose: bool = False, quiet: bool = False, log_to_file: bool = True, run_id: Optional[str] = None) -> None:
@@ -33,39 +76,107 @@ def setup_logging(verbose: bool = False, quiet: bool = False, log_to_file: bool
         log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
     date_format = '%Y-%m-%d %H:%M:%S'
-    
-    handlers = []
-    
+
+    # Pula a coleta de metadados de thread/processo em cada LogRecord
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # Nenhum formato usa %(filename)s/%(lineno)d: dispensa o sys._getframe
+    # que o findCaller executa a cada registro
+    logging._srcfile = None
+
+    # Console e arquivo ficam atrás de uma única fila: o caminho quente só
+    # enfileira o registro e a formatação/escrita acontece em thread de fundo
+    sink_handlers = []
+
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(logging.Formatter(log_format, date_format))
-    handlers.append(console_handler)
-    
+    sink_handlers.append(console_handler)
+
     if log_to_file:
         try:
             log_dir = ensure_directory('logs')
             log_file = log_dir / 'pdf_analyzer.log'
-            
-            file_handler = RotatingFileHandler(
+
+            # delay=True adia o open() do arquivo até o primeiro registro real
+            file_handler = FastRotatingFileHandler(
                 log_file,
                 maxBytes=5 * 1024 * 1024,
                 backupCount=3,
-                encoding='utf-8'
+                encoding='utf-8',
+                delay=True
             )
-            file_handler.setLevel(logging.DEBUG)
+            # Mesmo nível do console: sem --verbose, registros DEBUG nem são
+            # formatados, em vez de sempre irem para o arquivo
+            file_handler.setLevel(log_level)
             file_handler.setFormatter(logging.Formatter(log_format, date_format))
-            handlers.append(file_handler)
+            sink_handlers.append(file_handler)
         except Exception as error:
             print(f"[AVISO] Não foi possível configurar log em arquivo: {error}")
-    
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_listener = QueueListener(log_queue, *sink_handlers, respect_handler_level=True)
+    queue_listener.start()
+    atexit.register(queue_listener.stop)
+
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+    # O prepare() do QueueHandler aplica o formatter do próprio handler ao
+    # registro antes de enfileirar; só a mensagem aqui, senão os sinks
+    # aplicariam o formato completo em cima do prefixo já embutido
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
     logging.basicConfig(
         level=log_level,
-        format=log_format,
-        datefmt=date_format,
-        handlers=handlers
+        handlers=[queue_handler]
     )
 
 
+def _write_report_atomic(report_path: str, parts: List[str]) -> None:
+    """Grava o relatório com uma única escrita e rename atômico.
+
+    O conteúdo é codificado de uma vez e escrito via os.write num arquivo
+    temporário ao lado do destino, pulando a camada de texto do Python;
+    os.replace garante que o relatório nunca fica pela metade no disco.
+
+    Args:
+        report_path: Caminho final do relatório
+        parts: Trechos de Markdown já na ordem do documento
+    """
+    payload = "".join(parts).encode('utf-8')
+    tmp_path = f"{report_path}.tmp"
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    os.replace(tmp_path, report_path)
+
+
+def _file_size_display(analysis: Dict[str, Any]) -> str:
+    """Retorna o tamanho do arquivo formatado, memoizado na própria análise.
+
+    A string é exibida no console e repetida nos relatórios; formatá-la uma
+    única vez evita refazer format_bytes e a formatação com separadores.
+
+    Args:
+        analysis: Dicionário de análise contendo 'file_size_bytes'
+
+    Returns:
+        String no formato '12.34 MB (12,937,216 bytes)'
+    """
+    cached = analysis.get('_file_size_str')
+    if cached is None:
+        size_bytes = analysis['file_size_bytes']
+        cached = f"{format_bytes(size_bytes)} ({size_bytes:,} bytes)"
+        analysis['_file_size_str'] = cached
+    return cached
+
+
 def print_analysis_results(pdf_analysis: Dict[str, Any]) -> None:
     """
     Exibe os resultados da análise do PDF na saída padrão.
@@ -73,43 +184,43 @@ def print_analysis_results(pdf_analysis: Dict[str, Any]) -> None:
     Args:
         pdf_analysis: Dicionário contendo os resultados da análise
     """
-    SEPARATOR = "=" * 70
-    
-    print(f"\n{SEPARATOR}")
-    print("ANÁLISE DO PDF")
-    print(SEPARATOR)
-    print(f"\nArquivo: {pdf_analysis['file_name']}")
-    print(f"Caminho: {pdf_analysis['file_path']}")
-    print(f"\n📄 Número de páginas: {pdf_analysis['page_count']}")
-    print(f"📦 Tamanho do arquivo: {format_bytes(pdf_analysis['file_size_bytes'])} ({pdf_analysis['file_size_bytes']:,} bytes)")
-    print(f"📝 Total de palavras: {pdf_analysis['word_count']:,}")
-    print(f"📚 Tamanho do vocabulário: {pdf_analysis['vocabulary_size']:,} palavras distintas")
-    
+    # Monta a saída em memória e emite em uma única escrita no stdout
+    lines: List[str] = [_HEADER_ANALYSIS]
+    lines.append(f"\nArquivo: {pdf_analysis['file_name']}")
+    lines.append(f"Caminho: {pdf_analysis['file_path']}")
+    lines.append(f"\n📄 Número de páginas: {pdf_analysis['page_count']}")
+    lines.append(f"📦 Tamanho do arquivo: {_file_size_display(pdf_analysis)}")
+    lines.append(f"📝 Total de palavras: {pdf_analysis['word_count']:,}")
+    lines.append(f"📚 Tamanho do vocabulário: {pdf_analysis['vocabulary_size']:,} palavras distintas")
+
     if 'avg_words_per_page' in pdf_analysis:
-        print(f"📊 Média de palavras por página: {pdf_analysis['avg_words_per_page']:.2f}")
+        lines.append(f"📊 Média de palavras por página: {pdf_analysis['avg_words_per_page']:.2f}")
     if 'lexical_diversity' in pdf_analysis:
-        print(f"📈 Diversidade lexical: {pdf_analysis['lexical_diversity']:.2f}%")
-    
-    print(f"\n🔤 10 palavras mais comuns (sem stopwords):")
+        lines.append(f"📈 Diversidade lexical: {pdf_analysis['lexical_diversity']:.2f}%")
+
+    lines.append(f"\n🔤 10 palavras mais comuns (sem stopwords):")
     for position, (word, frequency) in enumerate(pdf_analysis['most_common_words'], start=1):
-        print(f"   {position:2}. {word:<20} ({frequency:,} ocorrências)")
-    
-    if 'titles' in pdf_analysis and pdf_analysis['titles']:
-        print(f"\n📑 Títulos detectados ({len(pdf_analysis['titles'])}):")
-        for title in pdf_analysis['titles'][:5]:
-            print(f"   - {title}")
-    
-    if 'sections' in pdf_analysis and pdf_analysis['sections']:
-        print(f"\n📋 Seções detectadas ({len(pdf_analysis['sections'])}):")
-        for section in pdf_analysis['sections'][:5]:
-            print(f"   {section['number']} {section['title']}")
-    
-    if 'keywords' in pdf_analysis and pdf_analysis['keywords']:
-        print(f"\n🔑 Palavras-chave principais:")
-        keywords_list = [word for word, _ in pdf_analysis['keywords'][:10]]
-        print(f"   {', '.join(keywords_list)}")
-    
-    print()
+        lines.append(f"   {position:2}. {word:<20} ({frequency:,} ocorrências)")
+
+    # Uma única consulta ao dict por seção opcional
+    titles = pdf_analysis.get('titles')
+    if titles:
+        lines.append(f"\n📑 Títulos detectados ({len(titles)}):")
+        lines.extend(f"   - {title}" for title in titles[:5])
+
+    sections = pdf_analysis.get('sections')
+    if sections:
+        lines.append(f"\n📋 Seções detectadas ({len(sections)}):")
+        lines.extend(f"   {section['number']} {section['title']}" for section in sections[:5])
+
+    keywords = pdf_analysis.get('keywords')
+    if keywords:
+        lines.append(f"\n🔑 Palavras-chave principais:")
+        keywords_list = [word for word, _ in keywords[:10]]
+        lines.append(f"   {', '.join(keywords_list)}")
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_image_results(extracted_images: List[str], output_directory: str) -> None:
@@ -120,26 +231,22 @@ def print_image_results(extracted_images: List[str], output_directory: str) -> N
         extracted_images: Lista de caminhos das imagens extraídas
         output_directory: Diretório onde as imagens foram salvas
     """
-    SEPARATOR = "=" * 70
     MAX_IMAGES_TO_SHOW = 5
-    
-    print(SEPARATOR)
-    print("EXTRAÇÃO DE IMAGENS")
-    print(SEPARATOR)
-    print(f"\n🖼️  Total de imagens extraídas: {len(extracted_images)}")
-    
+
+    lines: List[str] = [_HEADER_IMAGES]
+    lines.append(f"\n🖼️  Total de imagens extraídas: {len(extracted_images)}")
+
     if extracted_images:
-        print(f"📁 Diretório de saída: {output_directory}")
-        print(f"\nPrimeiras imagens:")
-        
-        for image_path in extracted_images[:MAX_IMAGES_TO_SHOW]:
-            print(f"   - {Path(image_path).name}")
-        
+        lines.append(f"📁 Diretório de saída: {output_directory}")
+        lines.append(f"\nPrimeiras imagens:")
+        lines.extend(f"   - {os.path.basename(image_path)}" for image_path in extracted_images[:MAX_IMAGES_TO_SHOW])
+
         remaining_images = len(extracted_images) - MAX_IMAGES_TO_SHOW
         if remaining_images > 0:
-            print(f"   ... e mais {remaining_images} imagens")
-    
-    print()
+            lines.append(f"   ... e mais {remaining_images} imagens")
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_summary(summary_text: str) -> None:
@@ -149,12 +256,80 @@ def print_summary(summary_text: str) -> None:
     Args:
         summary_text: Texto do resumo gerado
     """
-    SEPARATOR = "=" * 70
-    
-    print(SEPARATOR)
-    print("RESUMO DO DOCUMENTO (gerado por LLM)")
-    print(SEPARATOR)
-    print(f"\n{summary_text}\n")
+    sys.stdout.write(f"{_HEADER_SUMMARY}\n\n{summary_text}\n\n")
+
+
+def _append_report_sections(
+    parts: List[str],
+    analysis: Dict[str, Any],
+    image_paths: List[str],
+    summary_text: Optional[str],
+    extended_info: bool = False,
+    note_missing_summary: bool = False
+) -> None:
+    """Anexa as seções de conteúdo compartilhadas pelos dois relatórios.
+
+    Args:
+        parts: Lista de trechos Markdown sendo montada
+        analysis: Resultados da análise do PDF
+        image_paths: Lista de imagens extraídas
+        summary_text: Resumo gerado (ou None)
+        extended_info: Se True, inclui média de palavras/página e diversidade
+        note_missing_summary: Se True, registra a ausência do resumo na seção
+    """
+    parts.append(_MD_DOC_INFO)
+    parts.append(f"- **Arquivo**: `{analysis['file_name']}`\n")
+    parts.append(f"- **Caminho**: `{analysis['file_path']}`\n")
+    parts.append(f"- **Número de páginas**: {analysis['page_count']}\n")
+    parts.append(f"- **Tamanho**: {_file_size_display(analysis)}\n")
+    parts.append(f"- **Total de palavras**: {analysis['word_count']:,}\n")
+    parts.append(f"- **Vocabulário**: {analysis['vocabulary_size']:,} palavras distintas\n")
+
+    if extended_info:
+        if 'avg_words_per_page' in analysis:
+            parts.append(f"- **Média palavras/página**: {analysis['avg_words_per_page']:.2f}\n")
+        if 'lexical_diversity' in analysis:
+            parts.append(f"- **Diversidade lexical**: {analysis['lexical_diversity']:.2f}%\n")
+    parts.append("\n")
+
+    parts.append(_MD_COMMON_WORDS)
+    parts.extend(
+        f"| {position} | {word} | {frequency:,} |\n"
+        for position, (word, frequency) in enumerate(analysis['most_common_words'], start=1)
+    )
+    parts.append("\n")
+
+    titles = analysis.get('titles')
+    if titles:
+        parts.append(_MD_TITLES)
+        parts.extend(f"- {title}\n" for title in titles)
+        parts.append("\n")
+
+    sections = analysis.get('sections')
+    if sections:
+        parts.append(_MD_SECTIONS)
+        parts.extend(f"- **{section['number']}** {section['title']}\n" for section in sections)
+        parts.append("\n")
+
+    keywords = analysis.get('keywords')
+    if keywords:
+        parts.append(_MD_KEYWORDS)
+        keywords_text = ', '.join([word for word, _ in keywords])
+        parts.append(f"{keywords_text}\n\n")
+
+    parts.append(_MD_IMAGES)
+    parts.append(f"**Total**: {len(image_paths)} imagens\n\n")
+    if image_paths:
+        parts.append(_MD_IMAGE_LIST)
+        parts.extend(f"- `{os.path.basename(image_path)}`\n" for image_path in image_paths)
+        parts.append("\n")
+
+    if summary_text:
+        parts.append(_MD_SUMMARY)
+        parts.append(f"> {summary_text}\n\n")
+    elif note_missing_summary:
+        parts.append(_MD_SUMMARY)
+        parts.append("*Resumo não gerado (use --summarize para ativar)*\n\n")
 
 
 def generate_markdown_report(
@@ -173,80 +348,49 @@ def generate_markdown_report(
         report_output_path: Caminho onde salvar o relatório
     """
     logger = logging.getLogger(__name__)
-    logger.info(f"Gerando relatório Markdown: {report_output_path}")
-    
-    from datetime import datetime
-    
-    with open(report_output_path, 'w', encoding='utf-8') as report_file:
-        report_file.write("# 📊 Relatório Completo de Análise de PDF\n\n")
-        report_file.write(f"**Gerado em**: {datetime.now().strftime('%d/%m/%Y às %H:%M:%S')}\n\n")
-        report_file.write("---\n\n")
-        
-        report_file.write("## 📄 Informações do Documento\n\n")
-        report_file.write(f"- **Arquivo**: `{pdf_analysis['file_name']}`\n")
-        report_file.write(f"- **Caminho**: `{pdf_analysis['file_path']}`\n")
-        report_file.write(f"- **Número de páginas**: {pdf_analysis['page_count']}\n")
-        report_file.write(f"- **Tamanho**: {format_bytes(pdf_analysis['file_size_bytes'])} ({pdf_analysis['file_size_bytes']:,} bytes)\n")
-        report_file.write(f"- **Total de palavras**: {pdf_analysis['word_count']:,}\n")
-        report_file.write(f"- **Vocabulário**: {pdf_analysis['vocabulary_size']:,} palavras distintas\n\n")
-        
-        report_file.write("## 🔤 Palavras Mais Comuns\n\n")
-        report_file.write("| # | Palavra | Frequência |\n")
-        report_file.write("|---|---------|------------|\n")
-        for position, (word, frequency) in enumerate(pdf_analysis['most_common_words'], start=1):
-            report_file.write(f"| {position} | {word} | {frequency:,} |\n")
-        report_file.write("\n")
-        
-        if 'titles' in pdf_analysis and pdf_analysis['titles']:
-            report_file.write("## 📑 Títulos Detectados\n\n")
-            for title in pdf_analysis['titles']:
-                report_file.write(f"- {title}\n")
-            report_file.write("\n")
-        
-        if 'sections' in pdf_analysis and pdf_analysis['sections']:
-            report_file.write("## 📋 Seções Identificadas\n\n")
-            for section in pdf_analysis['sections']:
-                report_file.write(f"- **{section['number']}** {section['title']}\n")
-            report_file.write("\n")
-        
-        if 'keywords' in pdf_analysis and pdf_analysis['keywords']:
-            report_file.write("## 🔑 Palavras-Chave Principais\n\n")
-            keywords_text = ', '.join([word for word, _ in pdf_analysis['keywords']])
-            report_file.write(f"{keywords_text}\n\n")
-        
-        report_file.write("## 🖼️ Imagens Extraídas\n\n")
-        report_file.write(f"**Total**: {len(extracted_images)} imagens\n\n")
-        if extracted_images:
-            report_file.write("### Lista de Imagens\n\n")
-            for image_path in extracted_images:
-                report_file.write(f"- `{Path(image_path).name}`\n")
-            report_file.write("\n")
-        
-        if summary_text:
-            report_file.write("## 📝 Resumo Gerado por LLM\n\n")
-            report_file.write(f"> {summary_text}\n\n")
-        else:
-            report_file.write("## 📝 Resumo Gerado por LLM\n\n")
-            report_file.write("*Resumo não gerado (use --summarize para ativar)*\n\n")
-        
-        report_file.write("---\n\n")
-        report_file.write("## 📈 Estatísticas Consolidadas\n\n")
-        report_file.write(f"- Total de páginas analisadas: **{pdf_analysis['page_count']}**\n")
-        report_file.write(f"- Palavras únicas no vocabulário: **{pdf_analysis['vocabulary_size']:,}**\n")
-        report_file.write(f"- Taxa de diversidade lexical: **{(pdf_analysis['vocabulary_size'] / max(pdf_analysis['word_count'], 1) * 100):.2f}%**\n")
-        
-        if 'titles' in pdf_analysis:
-            report_file.write(f"- Títulos identificados: **{len(pdf_analysis['titles'])}**\n")
-        if 'sections' in pdf_analysis:
-            report_file.write(f"- Seções estruturadas: **{len(pdf_analysis['sections'])}**\n")
-        
-        report_file.write(f"- Imagens extraídas: **{len(extracted_images)}**\n")
-        report_file.write(f"- Resumo LLM: **{'✓ Gerado' if summary_text else '✗ Não gerado'}**\n\n")
-        
-        report_file.write("---\n\n")
-        report_file.write("*Relatório gerado automaticamente pela ferramenta CLI de Análise de PDF com Sumarização por LLM*\n")
-    
-    logger.info(f"Relatório salvo em: {report_output_path}")
+    logger.info("Gerando relatório Markdown: %s", report_output_path)
+
+    # Valores consultados mais de uma vez ao longo do relatório
+    n_images = len(extracted_images)
+    page_count = pdf_analysis['page_count']
+    word_count = pdf_analysis['word_count']
+    vocabulary_size = pdf_analysis['vocabulary_size']
+    lexical_diversity = vocabulary_size / max(word_count, 1) * 100
+
+    # Monta o relatório inteiro em memória e grava em uma única escrita,
+    # evitando um syscall por linha (relevante para listas grandes de imagens)
+    parts: List[str] = []
+    parts.append(_MD_TITLE)
+    parts.append(f"**Gerado em**: {datetime.now().strftime('%d/%m/%Y às %H:%M:%S')}\n\n")
+    parts.append(_MD_RULE)
+
+    _append_report_sections(
+        parts, pdf_analysis, extracted_images, summary_text,
+        note_missing_summary=True
+    )
+
+    titles = pdf_analysis.get('titles')
+    sections = pdf_analysis.get('sections')
+
+    parts.append(_MD_RULE)
+    parts.append("## 📈 Estatísticas Consolidadas\n\n")
+    parts.append(f"- Total de páginas analisadas: **{page_count}**\n")
+    parts.append(f"- Palavras únicas no vocabulário: **{vocabulary_size:,}**\n")
+    parts.append(f"- Taxa de diversidade lexical: **{lexical_diversity:.2f}%**\n")
+
+    if titles is not None:
+        parts.append(f"- Títulos identificados: **{len(titles)}**\n")
+    if sections is not None:
+        parts.append(f"- Seções estruturadas: **{len(sections)}**\n")
+
+    parts.append(f"- Imagens extraídas: **{n_images}**\n")
+    parts.append(f"- Resumo LLM: **{'✓ Gerado' if summary_text else '✗ Não gerado'}**\n\n")
+
+    parts.append(_MD_TRAILER_LLM)
+
+    _write_report_atomic(report_output_path, parts)
+
+    logger.info("Relatório salvo em: %s", report_output_path)
 
 
 def _run_pdf_analysis(args: Any, logger: logging.Logger) -> Dict[str, Any]:
@@ -260,40 +404,67 @@ def _run_pdf_analysis(args: Any, logger: logging.Logger) -> Dict[str, Any]:
         Dicionário com resultados da análise
     """
     logger.info("Iniciando análise do PDF...")
-    
+
+    # Import tardio: fitz (PyMuPDF) só é carregado quando há análise a fazer
+    from .pdf.extractor import PDFExtractor
+
+    # Reexecuções no mesmo PDF com os mesmos parâmetros reutilizam a análise
+    # já computada (chave inclui mtime/tamanho, então edições invalidam)
+    use_cache = not args.no_cache
+    if use_cache:
+        cache_key = make_cache_key(
+            args.pdf_file,
+            args.word_mode,
+            args.keep_numbers,
+            args.top_n_words,
+            args.no_structure
+        )
+        cached_analysis = cache_get(cache_key)
+        if cached_analysis is not None:
+            logger.info("Análise recuperada do cache em disco")
+            return cached_analysis
+
     with PDFExtractor(args.pdf_file) as extractor:
         if extractor.get_page_count() == 0:
             raise ValueError("[ERRO] PDF está vazio (0 páginas)")
-        
+
         max_pages = args.max_pages if args.max_pages else None
         if max_pages and extractor.get_page_count() > max_pages:
-            logger.info(f"Limitando análise aos primeiros {max_pages} páginas")
-        
+            logger.info("Limitando análise aos primeiros %s páginas", max_pages)
+
         analysis = extractor.analyze(
             word_mode=args.word_mode,
             keep_numbers=args.keep_numbers,
             top_n_words=args.top_n_words,
             analyze_structure=not args.no_structure
         )
-    
+
+    if use_cache:
+        # O texto completo não entra no cache: o resumo agora lê o PDF em
+        # streaming, e gravar megabytes de texto por entrada só inflaria o disco
+        cache_put(cache_key, {
+            key: value for key, value in analysis.items() if key != 'full_text'
+        })
     return analysis
 
 
-def _run_image_extraction(args: Any, logger: logging.Logger) -> List[str]:
+def _run_image_extraction(args: Any, output_dir: str, logger: logging.Logger) -> List[str]:
     """Executa extração de imagens do PDF.
-    
+
     Args:
         args: Argumentos parseados da linha de comando
+        output_dir: Diretório de destino das imagens
         logger: Logger configurado
-    
+
     Returns:
         Lista de caminhos das imagens extraídas
     """
     logger.info("Iniciando extração de imagens...")
-    
+
+    # Import tardio: só paga o custo do módulo quando --no-images não é usado
+    from .pdf.images import ImageExtractor
+
     with ImageExtractor(args.pdf_file) as img_extractor:
-        pdf_name = Path(args.pdf_file).stem
-        output_dir = args.output_dir or f"outputs/images/{pdf_name}"
         image_paths = img_extractor.extract_images(
             output_dir,
             min_size=args.min_image_size
@@ -302,30 +473,55 @@ def _run_image_extraction(args: Any, logger: logging.Logger) -> List[str]:
     return image_paths
 
 
-def _run_summarization(args: Any, analysis: Dict[str, Any], logger: logging.Logger) -> Optional[str]:
-    """Executa geração de resumo com LLM.
-    
+def _load_summarizer(args: Any) -> Any:
+    """Constrói o Summarizer, carregando os pesos do modelo.
+
+    Separado de _run_summarization para poder rodar num thread enquanto a
+    análise do PDF acontece no thread principal.
+
+    Args:
+        args: Argumentos parseados da linha de comando
+
+    Returns:
+        Instância de Summarizer pronta para uso
+    """
+    # Import tardio: evita carregar torch/transformers quando --no-summary é usado
+    from .llm.summarize import Summarizer
+
+    return Summarizer(model_name=args.model)
+
+
+def _run_summarization(args: Any, logger: logging.Logger, summarizer: Optional[Any] = None) -> Optional[str]:
+    """Executa geração de resumo com LLM em streaming.
+
+    O texto é lido página a página direto do PDF e enviado ao resumidor
+    sem nunca montar a string completa em memória.
+
     Args:
         args: Argumentos parseados da linha de comando
-        analysis: Resultados da análise do PDF
         logger: Logger configurado
-    
+        summarizer: Summarizer já carregado (ex: em paralelo), ou None
+
     Returns:
         Texto do resumo ou None
     """
     logger.info("Iniciando geração de resumo com LLM...")
-    print("="*70)
-    print("Gerando resumo com modelo de linguagem...")
-    print("(Isso pode levar alguns minutos na primeira execução)")
-    print("="*70 + "\n")
-    
-    summarizer = Summarizer(model_name=args.model)
-    summary = summarizer.summarize(
-        analysis['full_text'],
-        deterministic=args.deterministic
+    sys.stdout.write(
+        f"{_SEP}\nGerando resumo com modelo de linguagem...\n"
+        f"(Isso pode levar alguns minutos na primeira execução)\n{_SEP}\n\n"
     )
+
+    from .pdf.extractor import PDFExtractor
+
+    if summarizer is None:
+        summarizer = _load_summarizer(args)
+    with PDFExtractor(args.pdf_file) as extractor:
+        summary = summarizer.summarize_iter(
+            extractor.iter_pages(),
+            deterministic=args.deterministic
+        )
     summarizer.cleanup()
-    
+
     return summary
 
 
@@ -350,95 +546,49 @@ def _generate_report_with_metadata(
     Returns:
         Caminho do relatório gerado
     """
-    from datetime import datetime
-    import sys
-    
     pdf_name = Path(args.pdf_file).stem
     report_path = args.report or f"outputs/relatorio_{pdf_name}.md"
-    
+
     logger = logging.getLogger(__name__)
-    logger.info(f"Gerando relatório: {report_path}")
-    
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write("# 📊 Relatório Completo de Análise de PDF\n\n")
-        f.write(f"**Gerado em**: {datetime.now().strftime('%d/%m/%Y às %H:%M:%S')}\n")
-        f.write(f"**Run ID**: `{run_id}`\n")
-        f.write(f"**Duração**: {duration:.2f}s\n\n")
-        f.write("## 🔧 Configuração da Execução\n\n")
-        f.write(f"**Comando**: `{' '.join(sys.argv)}`\n\n")
-        f.write(f"- Modo de contagem: `{args.word_mode}`\n")
-        f.write(f"- Números contados: `{'Sim' if args.keep_numbers else 'Não'}`\n")
-        f.write(f"- Top N palavras: `{args.top_n_words}`\n")
-        f.write(f"- Análise de estrutura: `{'Não' if args.no_structure else 'Sim'}`\n")
-        if not args.no_summary:
-            f.write(f"- Modelo LLM: `{args.model}`\n")
-            f.write(f"- Modo determinístico: `{'Sim' if args.deterministic else 'Não'}`\n")
-        f.write("\n---\n\n")
-        
-        f.write("## 📄 Informações do Documento\n\n")
-        f.write(f"- **Arquivo**: `{analysis['file_name']}`\n")
-        f.write(f"- **Caminho**: `{analysis['file_path']}`\n")
-        f.write(f"- **Número de páginas**: {analysis['page_count']}\n")
-        f.write(f"- **Tamanho**: {format_bytes(analysis['file_size_bytes'])} ({analysis['file_size_bytes']:,} bytes)\n")
-        f.write(f"- **Total de palavras**: {analysis['word_count']:,}\n")
-        f.write(f"- **Vocabulário**: {analysis['vocabulary_size']:,} palavras distintas\n")
-        
-        if 'avg_words_per_page' in analysis:
-            f.write(f"- **Média palavras/página**: {analysis['avg_words_per_page']:.2f}\n")
-        if 'lexical_diversity' in analysis:
-            f.write(f"- **Diversidade lexical**: {analysis['lexical_diversity']:.2f}%\n")
-        f.write("\n")
-        
-        f.write("## 🔤 Palavras Mais Comuns\n\n")
-        f.write("| # | Palavra | Frequência |\n")
-        f.write("|---|---------|------------|\n")
-        for i, (word, freq) in enumerate(analysis['most_common_words'], 1):
-            f.write(f"| {i} | {word} | {freq:,} |\n")
-        f.write("\n")
-        
-        if analysis.get('titles'):
-            f.write("## 📑 Títulos Detectados\n\n")
-            for title in analysis['titles']:
-                f.write(f"- {title}\n")
-            f.write("\n")
-        
-        if analysis.get('sections'):
-            f.write("## 📋 Seções Identificadas\n\n")
-            for section in analysis['sections']:
-                f.write(f"- **{section['number']}** {section['title']}\n")
-            f.write("\n")
-        
-        if analysis.get('keywords'):
-            f.write("## 🔑 Palavras-Chave Principais\n\n")
-            keywords_text = ', '.join([word for word, _ in analysis['keywords']])
-            f.write(f"{keywords_text}\n\n")
-        
-        f.write("## 🖼️ Imagens Extraídas\n\n")
-        f.write(f"**Total**: {len(image_paths)} imagens\n\n")
-        if image_paths:
-            f.write("### Lista de Imagens\n\n")
-            for img_path in image_paths:
-                f.write(f"- `{Path(img_path).name}`\n")
-            f.write("\n")
-        
-        if summary:
-            f.write("## 📝 Resumo Gerado por LLM\n\n")
-            f.write(f"> {summary}\n\n")
-        
-        f.write("---\n\n")
-        f.write("*Relatório gerado automaticamente pela ferramenta CLI de Análise de PDF*\n")
-    
+    logger.info("Gerando relatório: %s", report_path)
+
+    # Mesmo padrão de generate_markdown_report: monta tudo em memória e
+    # grava com uma única escrita, em vez de ~40 writes pequenos
+    parts: List[str] = []
+    parts.append(_MD_TITLE)
+    parts.append(f"**Gerado em**: {datetime.now().strftime('%d/%m/%Y às %H:%M:%S')}\n")
+    parts.append(f"**Run ID**: `{run_id}`\n")
+    parts.append(f"**Duração**: {duration:.2f}s\n\n")
+    parts.append("## 🔧 Configuração da Execução\n\n")
+    parts.append(f"**Comando**: `{' '.join(sys.argv)}`\n\n")
+    parts.append(f"- Modo de contagem: `{args.word_mode}`\n")
+    parts.append(f"- Números contados: `{'Sim' if args.keep_numbers else 'Não'}`\n")
+    parts.append(f"- Top N palavras: `{args.top_n_words}`\n")
+    parts.append(f"- Análise de estrutura: `{'Não' if args.no_structure else 'Sim'}`\n")
+    if not args.no_summary:
+        parts.append(f"- Modelo LLM: `{args.model}`\n")
+        parts.append(f"- Modo determinístico: `{'Sim' if args.deterministic else 'Não'}`\n")
+    parts.append("\n---\n\n")
+
+    _append_report_sections(parts, analysis, image_paths, summary, extended_info=True)
+
+    parts.append(_MD_TRAILER)
+
+    _write_report_atomic(report_path, parts)
+
     return report_path
 
 
 def main() -> int:
     """Função principal do programa."""
     import time
-    from datetime import datetime
-    
-    parser = create_parser()
-    args = parser.parse_args()
     
+    # Fast-path para `python -m src.main arquivo.pdf`: pula o argparse completo
+    args = parse_args_fast()
+    if args is None:
+        parser = create_parser()
+        args = parser.parse_args()
+
     if not validate_args(args):
         return 1
     
@@ -449,56 +599,111 @@ def main() -> int:
     setup_logging(verbose=args.verbose, quiet=args.quiet, log_to_file=args.log, run_id=run_id)
     logger = logging.getLogger(__name__)
     
-    logger.info(f"[Run ID: {run_id}] Iniciando processamento do PDF")
-    
+    logger.info("[Run ID: %s] Iniciando processamento do PDF", run_id)
+
+    # Deriva o nome base do PDF uma única vez: é reusado em caminhos de
+    # saída de imagens e do relatório sem reconstruir Path a cada uso
+    pdf_stem = Path(args.pdf_file).stem
+
+    # Memoização da execução inteira: a chave cobre o PDF (mtime/tamanho) e
+    # todos os argumentos, então uma reinvocação idêntica pode só apontar
+    # para o relatório já gerado. --force reprocessa incondicionalmente
+    run_cache_key = None
+    if not args.no_report and not args.no_cache:
+        run_cache_key = make_cache_key(args.pdf_file, 'run', repr(sorted(vars(args).items())))
+        if not args.force:
+            cached_report = cache_get(run_cache_key)
+            if cached_report and Path(cached_report).exists():
+                logger.info("[Run ID: %s] Execução idêntica encontrada no cache", run_id)
+                print(f"✅ Execução idêntica já processada (use --force para refazer)")
+                print(f"📋 Relatório: {cached_report}\n")
+                return 0
+
     try:
-        # 1. Análise do PDF
-        analysis = _run_pdf_analysis(args, logger)
-        print_analysis_results(analysis)
-        
-        # 2. Extração de imagens
+        # As três fontes de latência dominantes — análise (CPU), extração de
+        # imagens (I/O) e carga dos pesos do LLM (disco/rede) — rodam
+        # sobrepostas: imagens e modelo partem em threads enquanto a análise
+        # ocupa o thread principal. Os prints acontecem depois, na ordem de
+        # sempre. Cada thread abre seu próprio documento: o Document do
+        # MuPDF não é thread-safe.
         image_paths = []
-        if not args.no_images:
-            image_paths = _run_image_extraction(args, logger)
-            output_dir = args.output_dir or f"outputs/images/{Path(args.pdf_file).stem}"
-            print_image_results(image_paths, output_dir)
-        
-        # 3. Geração de resumo com LLM
         summary = None
-        if not args.no_summary:
-            summary = _run_summarization(args, analysis, logger)
-            if summary:
-                print_summary(summary)
+        run_images = not args.no_images
+        run_summary = not args.no_summary
+        images_output_dir = args.output_dir or f"outputs/images/{pdf_stem}"
+
+        executor = None
+        images_future = None
+        summarizer_future = None
+        if run_images or run_summary:
+            from concurrent.futures import ThreadPoolExecutor
+
+            executor = ThreadPoolExecutor(max_workers=2)
+            if run_summary:
+                summarizer_future = executor.submit(_load_summarizer, args)
+            if run_images:
+                images_future = executor.submit(_run_image_extraction, args, images_output_dir, logger)
+
+        try:
+            # 1. Análise do PDF (thread principal)
+            analysis = _run_pdf_analysis(args, logger)
+            print_analysis_results(analysis)
+
+            # 2. Extração de imagens
+            if images_future is not None:
+                image_paths = images_future.result()
+                print_image_results(image_paths, images_output_dir)
+
+            # 3. Resumo com o modelo já carregado em paralelo
+            if summarizer_future is not None:
+                # Remove o texto completo da análise antes do resumo, evitando
+                # que texto e pesos do LLM coexistam no pico de memória
+                analysis.pop('full_text', None)
+                summary = _run_summarization(args, logger, summarizer=summarizer_future.result())
+                if summary:
+                    print_summary(summary)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
         
-        # 4. Geração de relatório final
+        # 4. Geração de relatório final (pulada com --no-report, ex: lotes
+        # de PDFs onde só a análise no console interessa)
         duration = time.time() - start_time
-        report_path = args.report
-        if not report_path:
-            pdf_name = Path(args.pdf_file).stem
-            report_path = f"outputs/relatorio_{pdf_name}.md"
-        
-        _generate_report_with_metadata(args, analysis, image_paths, summary, run_id, duration)
-        print(f"📋 Relatório completo salvo em: {report_path}\n")
-        
-        print("="*70)
-        print(f"✅ Processamento concluído em {duration:.2f}s!")
-        print("="*70 + "\n")
-        
-        logger.info(f"[Run ID: {run_id}] Processamento concluído com sucesso em {duration:.2f}s")
+        if not args.no_report:
+            report_path = args.report
+            if not report_path:
+                report_path = f"outputs/relatorio_{pdf_stem}.md"
+
+            _generate_report_with_metadata(args, analysis, image_paths, summary, run_id, duration)
+            print(f"📋 Relatório completo salvo em: {report_path}\n")
+
+            if run_cache_key is not None:
+                cache_put(run_cache_key, report_path)
+
+        # Banner final só em terminal interativo: saída redirecionada
+        # (pipelines em lote) não ganha decoração extra
+        if sys.stdout.isatty():
+            print(_SEP)
+            print(f"✅ Processamento concluído em {duration:.2f}s!")
+            print(_SEP + "\n")
+
+        logger.info("[Run ID: %s] Processamento concluído com sucesso em %.2fs", run_id, duration)
         return 0
     
     except FileNotFoundError as e:
-        logger.error(f"[ERRO] Arquivo não encontrado: {e}")
+        logger.error("[ERRO] Arquivo não encontrado: %s", e)
         print(f"\n❌ [ERRO] Arquivo não encontrado: {e}\n")
         return 1
     
     except ValueError as e:
-        logger.error(f"[ERRO] Validação: {e}")
+        logger.error("[ERRO] Validação: %s", e)
         print(f"\n❌ {e}\n")
         return 1
     
     except Exception as e:
-        logger.error(f"[ERRO] Erro durante o processamento: {e}", exc_info=True)
+        # Traceback completo só com --verbose: evita formatar e gravar
+        # megabytes de stack trace em execuções silenciosas
+        logger.error("[ERRO] Erro durante o processamento: %s", e, exc_info=args.verbose)
         print(f"\n❌ [ERRO] Erro inesperado: {e}\n")
         return 1
 
@@ -1,57 +1,305 @@
+import io
 import logging
+import mmap
+import multiprocessing
+import os
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from operator import methodcaller
 import fitz
 import re
 
-from ..utils.text import count_words, get_vocabulary_size, get_most_common_words
+from ..utils.text import get_most_common_words, get_word_statistics
 from ..utils.files import get_file_size
 
 logger = logging.getLogger(__name__)
 
+# A partir deste número de páginas a extração paralela compensa o custo
+# de criar os processos workers
+_PARALLEL_PAGE_THRESHOLD = 16
+
+# Flags mínimas para extração de texto puro: sem ligaduras nem imagens,
+# com hífens de quebra de linha já resolvidos pelo MuPDF. O consumidor é
+# tokenização/LLM, que não usa a estrutura de blocos do extrator completo
+_TEXT_FLAGS = fitz.TEXT_DEHYPHENATE | fitz.TEXT_MEDIABOX_CLIP
+
+# Padrão de cabeçalhos de seção (numéricos, romanos ou alfabéticos),
+# compilado uma vez na importação em vez de a cada detect_sections
+_SECTION_RE = re.compile(r'^(\d+\.?\s+|[IVX]+\.?\s+|[A-Z]\.?\s+)(.+)$', re.MULTILINE)
+
+# Bit de negrito nos flags de span do PyMuPDF
+_BOLD_FLAG = 1 << 4
+
+
+_mupdf_warmed = False
+
+
+def _warm_mupdf() -> None:
+    """Aquece as tabelas de recursos do MuPDF uma única vez por processo.
+
+    Abrir e fechar um documento descartável força a inicialização dos
+    caches de fontes/encoding compartilhados, para que o primeiro
+    get_text de um documento real não pague esse custo. Roda na
+    importação do módulo (que já é tardia), inclusive nos processos
+    workers da extração paralela ao importarem este módulo.
+    """
+    global _mupdf_warmed
+    if _mupdf_warmed:
+        return
+
+    try:
+        warm_doc = fitz.open()
+        warm_doc.new_page()
+        warm_doc.close()
+    except Exception as error:
+        logger.debug("Aquecimento do MuPDF falhou (ignorado): %s", error)
+
+    _mupdf_warmed = True
+
+
+_warm_mupdf()
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Contexto de multiprocessing que não usa fork.
+
+    O main() sobrepõe a análise com threads (carga do sumarizador, imagens);
+    dar fork num processo com threads pode herdar locks de import/logging
+    presos nos workers. forkserver/spawn partem de um processo limpo, e os
+    workers só recebem um caminho e dois inteiros — nada depende do fork.
+    """
+    try:
+        return multiprocessing.get_context('forkserver')
+    except ValueError:
+        return multiprocessing.get_context('spawn')
+
+
+# None = ainda não testado; False = o PyMuPDF instalado rejeita streams
+# mapeados (TypeError na primeira tentativa), então os opens seguintes vão
+# direto ao caminho tradicional sem repetir mmap + exceção + munmap
+_mmap_stream_supported: Optional[bool] = None
+
+
+def open_document_mmap(pdf_path: str) -> Tuple[fitz.Document, Optional[mmap.mmap]]:
+    """Abre um PDF sobre um mapeamento de memória somente leitura.
+
+    Com mmap o page-cache do kernel é o único buffer dos bytes do arquivo,
+    em vez de uma segunda cópia no leitor de stream do MuPDF. Arquivos que
+    não podem ser mapeados (ex: vazios) caem no open tradicional.
+
+    Args:
+        pdf_path: Caminho do PDF
+
+    Returns:
+        Tupla (documento aberto, mapeamento ou None no fallback)
+    """
+    global _mmap_stream_supported
+
+    if _mmap_stream_supported is False:
+        return fitz.open(pdf_path), None
+
+    try:
+        fd = os.open(pdf_path, os.O_RDONLY)
+        try:
+            mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            # O mapeamento mantém o arquivo vivo; o descritor pode fechar já
+            os.close(fd)
+    except (OSError, ValueError) as error:
+        logger.debug("mmap indisponível para %s (%s), usando open padrão", pdf_path, error)
+        return fitz.open(pdf_path), None
+
+    # A extração percorre as páginas em ordem: avisar o kernel permite
+    # prefetch agressivo e descarte das páginas já lidas (menos RSS em
+    # PDFs grandes). Indisponível em algumas plataformas, daí o hasattr
+    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+        try:
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        except OSError as error:
+            logger.debug("madvise(MADV_SEQUENTIAL) falhou (ignorado): %s", error)
+
+    try:
+        doc = fitz.open(stream=mapped, filetype='pdf')
+        _mmap_stream_supported = True
+        return doc, mapped
+    except TypeError:
+        # Algumas versões do PyMuPDF só aceitam bytes/BytesIO como stream;
+        # a recusa é da versão instalada, não do arquivo, então vale para
+        # todos os documentos deste processo
+        mapped.close()
+        _mmap_stream_supported = False
+        logger.debug("PyMuPDF sem suporte a stream mapeado, usando open padrão")
+        return fitz.open(pdf_path), None
+    except Exception:
+        mapped.close()
+        raise
+
+
+def _extract_range(pdf_path: str, start: int, stop: int) -> str:
+    """Extrai o texto de uma faixa de páginas em um processo worker.
+
+    Cada worker abre o documento pelo caminho: o MuPDF é reentrante entre
+    processos, então as faixas são extraídas em paralelo sem disputa.
+
+    Args:
+        pdf_path: Caminho do PDF
+        start: Primeira página da faixa (inclusiva)
+        stop: Última página da faixa (exclusiva)
+
+    Returns:
+        Texto das páginas da faixa unido por quebras de linha
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        # map + methodcaller itera as páginas no laço C do interpretador,
+        # sem subscript nem lookup de método por página
+        return '\n'.join(map(
+            methodcaller('get_text', 'text', flags=_TEXT_FLAGS),
+            doc.pages(start, stop)
+        ))
+    finally:
+        doc.close()
+
+
+def _count_words_range(pdf_path: str, start: int, stop: int) -> int:
+    """Conta as palavras de uma faixa de páginas em um processo worker.
+
+    Args:
+        pdf_path: Caminho do PDF
+        start: Primeira página da faixa (inclusiva)
+        stop: Última página da faixa (exclusiva)
+
+    Returns:
+        Total de palavras (modo estrutural do PDF) na faixa
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        return sum(
+            len(words) for words in map(
+                methodcaller('get_text', 'words'),
+                doc.pages(start, stop)
+            )
+        )
+    finally:
+        doc.close()
+
+
+def _page_ranges(total_pages: int) -> List[Tuple[int, int]]:
+    """Divide as páginas em faixas contíguas, uma por worker disponível."""
+    workers = min(os.cpu_count() or 1, total_pages)
+    chunk_size = -(-total_pages // workers)
+    return [
+        (start, min(start + chunk_size, total_pages))
+        for start in range(0, total_pages, chunk_size)
+    ]
+
 
 class PDFExtractor:
     
     def __init__(self, pdf_path: str):
         """Inicializa o extrator de PDF com tratamento robusto de erros."""
         self.pdf_path = Path(pdf_path)
+        self._text: Optional[str] = None
+        self._titles: Optional[List[str]] = None
+        self._sections: Optional[List[Dict[str, Any]]] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._file_size: Optional[int] = None
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"Arquivo não encontrado: {pdf_path}")
-        
+
         try:
-            self.doc = fitz.open(pdf_path)
-            logger.info(f"PDF carregado: {pdf_path} ({len(self.doc)} páginas)")
+            self.doc, self._mmap = open_document_mmap(pdf_path)
+            logger.info("PDF carregado: %s (%s páginas)", pdf_path, len(self.doc))
         except fitz.FileDataError as error:
-            logger.error(f"PDF corrompido ou inválido: {error}")
+            logger.error("PDF corrompido ou inválido: %s", error)
             raise ValueError(f"Não foi possível abrir o PDF: arquivo corrompido ou inválido") from error
         except Exception as error:
-            logger.error(f"Erro ao abrir PDF: {error}")
+            logger.error("Erro ao abrir PDF: %s", error)
             raise
     
-    def extract_text(self) -> str:
-        """Extrai todo o texto do PDF com tratamento de erros por página."""
-        text_parts = []
+    def iter_pages(self) -> Iterator[str]:
+        """Itera sobre o texto de cada página sem concatenar o documento inteiro.
+
+        Yields:
+            Texto de cada página, com tratamento de erros por página
+        """
         total_pages = len(self.doc)
-        
+
         for page_num in range(total_pages):
             try:
                 page = self.doc[page_num]
-                text = page.get_text()
-                text_parts.append(text)
-                
+                yield page.get_text("text", flags=_TEXT_FLAGS)
+
                 if (page_num + 1) % 50 == 0:
-                    logger.debug(f"Processadas {page_num + 1}/{total_pages} páginas")
-                    
+                    logger.debug("Processadas %s/%s páginas", page_num + 1, total_pages)
+
             except MemoryError:
-                logger.error(f"Memória insuficiente ao processar página {page_num + 1}")
+                logger.error("Memória insuficiente ao processar página %s", page_num + 1)
                 raise MemoryError(f"Memória insuficiente para processar PDF grande. Tente dividir o arquivo.") from None
             except Exception as error:
-                logger.warning(f"Erro ao extrair texto da página {page_num + 1}: {error}")
-                text_parts.append(f"[Erro na página {page_num + 1}]")
-        
-        full_text = '\n'.join(text_parts)
-        logger.info(f"Texto extraído: {len(full_text)} caracteres de {total_pages} páginas")
-        return full_text
+                logger.warning("Erro ao extrair texto da página %s: %s", page_num + 1, error)
+                yield f"[Erro na página {page_num + 1}]"
+
+    def _extract_text_sequential(self) -> str:
+        """Acumula o texto das páginas num buffer único de crescimento amortizado.
+
+        Escrever num io.StringIO evita materializar a lista de páginas e a
+        segunda cópia completa que '\\n'.join faria, reduzindo o pico de
+        memória em documentos grandes.
+        """
+        buffer = io.StringIO()
+        first_page = True
+
+        for page_text in self.iter_pages():
+            if first_page:
+                first_page = False
+            else:
+                buffer.write('\n')
+            buffer.write(page_text)
+
+        return buffer.getvalue()
+
+    def _extract_text_parallel(self) -> str:
+        """Extrai o texto dividindo as páginas entre processos workers."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        total_pages = len(self.doc)
+        ranges = _page_ranges(total_pages)
+
+        logger.debug("Extração paralela: %s páginas em %s workers", total_pages, len(ranges))
+        pdf_path = str(self.pdf_path)
+        with ProcessPoolExecutor(max_workers=len(ranges), mp_context=_pool_context()) as executor:
+            parts = executor.map(
+                _extract_range,
+                [pdf_path] * len(ranges),
+                [start for start, _ in ranges],
+                [stop for _, stop in ranges]
+            )
+            return '\n'.join(parts)
+
+    def extract_text(self) -> str:
+        """Extrai todo o texto do PDF com tratamento de erros por página.
+
+        O resultado é cacheado na instância: chamadas repetidas durante a
+        análise não releem o documento. Documentos grandes são extraídos
+        em paralelo, com fallback para o caminho sequencial em caso de erro.
+        """
+        if self._text is not None:
+            return self._text
+
+        total_pages = len(self.doc)
+
+        if total_pages > _PARALLEL_PAGE_THRESHOLD and (os.cpu_count() or 1) > 1:
+            try:
+                self._text = self._extract_text_parallel()
+            except Exception as error:
+                logger.warning("Extração paralela falhou, usando caminho sequencial: %s", error)
+                self._text = self._extract_text_sequential()
+        else:
+            self._text = self._extract_text_sequential()
+
+        logger.info("Texto extraído: %s caracteres de %s páginas", len(self._text), total_pages)
+        return self._text
     
     def count_words_from_pdf(self) -> int:
         """Conta palavras usando estrutura interna do PDF (mais preciso).
@@ -65,77 +313,117 @@ class PDFExtractor:
         """
         total_words = 0
         total_pages = len(self.doc)
-        
+
+        # Mesmo critério da extração de texto: documentos grandes dividem
+        # as páginas entre processos workers, com fallback sequencial
+        if total_pages > _PARALLEL_PAGE_THRESHOLD and (os.cpu_count() or 1) > 1:
+            try:
+                from concurrent.futures import ProcessPoolExecutor
+
+                ranges = _page_ranges(total_pages)
+                pdf_path = str(self.pdf_path)
+                with ProcessPoolExecutor(max_workers=len(ranges), mp_context=_pool_context()) as executor:
+                    total_words = sum(executor.map(
+                        _count_words_range,
+                        [pdf_path] * len(ranges),
+                        [start for start, _ in ranges],
+                        [stop for _, stop in ranges]
+                    ))
+                logger.info("Contagem de palavras (modo PDF, paralela): %s palavras", total_words)
+                return total_words
+            except Exception as error:
+                logger.warning("Contagem paralela falhou, usando caminho sequencial: %s", error)
+                total_words = 0
+
         try:
-            for page_num in range(total_pages):
+            # Iterar o documento evita o __getitem__ que re-resolve a
+            # página na camada C a cada acesso
+            for page_num, page in enumerate(self.doc):
                 try:
-                    page = self.doc[page_num]
                     words = page.get_text("words")
                     total_words += len(words)
                 except Exception as error:
-                    logger.warning(f"Erro ao contar palavras da página {page_num + 1}: {error}")
+                    logger.warning("Erro ao contar palavras da página %s: %s", page_num + 1, error)
                     
-            logger.info(f"Contagem de palavras (modo PDF): {total_words} palavras")
+            logger.info("Contagem de palavras (modo PDF): %s palavras", total_words)
             return total_words
         except Exception as error:
-            logger.error(f"Erro na contagem de palavras do PDF: {error}")
+            logger.error("Erro na contagem de palavras do PDF: %s", error)
             return 0
     
     def detect_titles(self) -> List[str]:
-        """Detecta possíveis títulos baseado no tamanho da fonte e formatação."""
+        """Detecta possíveis títulos baseado no tamanho da fonte e formatação.
+
+        O resultado é memoizado na instância, como em extract_text.
+        """
+        if self._titles is not None:
+            return self._titles
+
         titles = []
-        
+        titles_append = titles.append
+
         try:
-            for page_num in range(len(self.doc)):
-                page = self.doc[page_num]
+            for page in self.doc:
                 blocks = page.get_text("dict")["blocks"]
-                
+
                 for block in blocks:
                     if "lines" not in block:
                         continue
-                    
+
                     for line in block["lines"]:
                         for span in line["spans"]:
+                            # Critérios mais baratos primeiro: a maioria dos
+                            # spans é corpo de texto e sai no teste de fonte,
+                            # antes do strip/split
+                            if not (span["flags"] & _BOLD_FLAG) and span["size"] <= 12:
+                                continue
+
                             text = span["text"].strip()
-                            font_size = span["size"]
-                            font_flags = span["flags"]
-                            
-                            is_bold = font_flags & 2**4
-                            is_large = font_size > 12
-                            is_short = len(text.split()) <= 15
-                            
-                            if text and (is_bold or is_large) and is_short:
-                                titles.append(text)
+                            if text and len(text.split()) <= 15:
+                                titles_append(text)
             
-            logger.info(f"Detectados {len(titles)} possíveis títulos")
+            logger.info("Detectados %s possíveis títulos", len(titles))
         except Exception as error:
-            logger.warning(f"Erro ao detectar títulos: {error}")
-        
+            logger.warning("Erro ao detectar títulos: %s", error)
+
+        self._titles = titles
         return titles
-    
+
     def detect_sections(self) -> List[Dict[str, Any]]:
-        """Detecta seções baseado em padrões numéricos e de texto."""
+        """Detecta seções baseado em padrões numéricos e de texto.
+
+        O resultado é memoizado na instância, como em extract_text.
+        """
+        if self._sections is not None:
+            return self._sections
+
         sections = []
-        section_pattern = re.compile(r'^(\d+\.?\s+|[IVX]+\.?\s+|[A-Z]\.?\s+)(.+)$', re.MULTILINE)
-        
+
         try:
-            text = self.extract_text()
-            matches = section_pattern.finditer(text)
-            
-            for match in matches:
-                section_number = match.group(1).strip()
-                section_title = match.group(2).strip()
-                
-                if len(section_title) > 5 and len(section_title) < 200:
-                    sections.append({
-                        'number': section_number,
-                        'title': section_title
-                    })
-            
-            logger.info(f"Detectadas {len(sections)} seções")
+            # Reusa o texto já extraído quando disponível; caso contrário
+            # varre página a página, sem materializar o documento inteiro
+            # só para o finditer (as seções vivem dentro de uma página)
+            if self._text is not None:
+                pieces = (self._text,)
+            else:
+                pieces = self.iter_pages()
+
+            for piece in pieces:
+                for match in _SECTION_RE.finditer(piece):
+                    section_number = match.group(1).strip()
+                    section_title = match.group(2).strip()
+
+                    if 5 < len(section_title) < 200:
+                        sections.append({
+                            'number': section_number,
+                            'title': section_title
+                        })
+
+            logger.info("Detectadas %s seções", len(sections))
         except Exception as error:
-            logger.warning(f"Erro ao detectar seções: {error}")
-        
+            logger.warning("Erro ao detectar seções: %s", error)
+
+        self._sections = sections
         return sections
     
     def extract_keywords(self, n: int = 15) -> List[Tuple[str, int]]:
@@ -143,17 +431,20 @@ class PDFExtractor:
         try:
             text = self.extract_text()
             keywords = get_most_common_words(text, n=n, remove_stopwords=True)
-            logger.info(f"Extraídas {len(keywords)} palavras-chave")
+            logger.info("Extraídas %s palavras-chave", len(keywords))
             return keywords
         except Exception as error:
-            logger.warning(f"Erro ao extrair palavras-chave: {error}")
+            logger.warning("Erro ao extrair palavras-chave: %s", error)
             return []
     
     def get_page_count(self) -> int:
         return len(self.doc)
     
     def get_file_size(self) -> int:
-        return get_file_size(str(self.pdf_path))
+        # Um stat por documento basta: o arquivo não muda durante a análise
+        if self._file_size is None:
+            self._file_size = get_file_size(str(self.pdf_path))
+        return self._file_size
     
     def analyze(self, word_mode: str = 'text', keep_numbers: bool = False, top_n_words: int = 10, analyze_structure: bool = True) -> Dict[str, Any]:
         """Realiza análise completa do PDF incluindo estrutura e metadados.
@@ -174,16 +465,14 @@ class PDFExtractor:
             page_count = self.get_page_count()
             file_size = self.get_file_size()
             
-            logger.debug(f"Analisando métricas de texto (modo: {word_mode})...")
-            
+            logger.debug("Analisando métricas de texto (modo: %s)...", word_mode)
+
+            # Uma única tokenização cobre contagem, vocabulário e mais comuns
+            word_count, vocabulary_size, most_common = get_word_statistics(
+                text, n=top_n_words, keep_numbers=keep_numbers
+            )
             if word_mode == 'pdf':
                 word_count = self.count_words_from_pdf()
-                vocabulary_size = get_vocabulary_size(text, keep_numbers=keep_numbers)
-                most_common = get_most_common_words(text, n=top_n_words, keep_numbers=keep_numbers)
-            else:
-                word_count = count_words(text, keep_numbers=keep_numbers)
-                vocabulary_size = get_vocabulary_size(text, keep_numbers=keep_numbers)
-                most_common = get_most_common_words(text, n=top_n_words, keep_numbers=keep_numbers)
             
             avg_words_per_page = word_count / max(page_count, 1)
             lexical_diversity = (vocabulary_size / max(word_count, 1)) * 100
@@ -218,13 +507,19 @@ class PDFExtractor:
             logger.error("Memória insuficiente para analisar PDF")
             raise
         except Exception as error:
-            logger.error(f"Erro durante análise: {error}")
+            logger.error("Erro durante análise: %s", error)
             raise RuntimeError(f"Falha ao analisar PDF: {error}") from error
     
     def close(self) -> None:
+        self._text = None
+        self._titles = None
+        self._sections = None
         if self.doc:
             self.doc.close()
             logger.info("PDF fechado")
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
     
     def __enter__(self) -> 'PDFExtractor':
         return self
@@ -1,8 +1,12 @@
 import logging
+import mmap
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Any, Tuple
 import fitz
 
+from .extractor import open_document_mmap
 from ..utils.files import ensure_directory, get_unique_filename
 
 logger = logging.getLogger(__name__)
@@ -13,17 +17,20 @@ class ImageExtractor:
     def __init__(self, pdf_path: str):
         """Inicializa o extrator de imagens com tratamento de erros."""
         self.pdf_path = Path(pdf_path)
+        self._mmap: Optional[mmap.mmap] = None
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"Arquivo não encontrado: {pdf_path}")
-        
+
         try:
-            self.doc = fitz.open(pdf_path)
-            logger.info(f"PDF carregado para extração de imagens: {pdf_path}")
+            # mmap compartilha as páginas do cache do SO com o PDFExtractor
+            # aberto em paralelo sobre o mesmo arquivo
+            self.doc, self._mmap = open_document_mmap(pdf_path)
+            logger.info("PDF carregado para extração de imagens: %s", pdf_path)
         except fitz.FileDataError as error:
-            logger.error(f"PDF inválido ou corrompido: {error}")
+            logger.error("PDF inválido ou corrompido: %s", error)
             raise ValueError("Não foi possível abrir o PDF para extração de imagens") from error
         except Exception as error:
-            logger.error(f"Erro ao abrir PDF: {error}")
+            logger.error("Erro ao abrir PDF: %s", error)
             raise
     
     def extract_images(self, output_dir: Optional[str] = None, min_size: int = 100) -> List[str]:
@@ -42,74 +49,97 @@ class ImageExtractor:
         
         output_path = ensure_directory(output_dir)
         extracted_images = []
-        
-        logger.info(f"Extraindo imagens para: {output_path} (min_size: {min_size}px)")
-        
+
+        logger.info("Extraindo imagens para: %s (min_size: %spx)", output_path, min_size)
+
         image_counter = 0
         skipped_small = 0
         total_pages = len(self.doc)
-        
+
+        # As escritas em disco vão para um pool de threads: write_bytes
+        # libera o GIL durante o I/O, então a decodificação das próximas
+        # imagens prossegue enquanto as anteriores são gravadas
+        executor = ThreadPoolExecutor(max_workers=8)
+        pending_writes: List[Tuple[Future, str]] = []
+
+        # Uma única varredura do diretório substitui o stat por tentativa
+        # que get_unique_filename faria para cada imagem
+        existing_names = {entry.name for entry in os.scandir(output_path)}
+
         for page_num in range(total_pages):
             try:
                 page = self.doc[page_num]
                 image_list = page.get_images()
                 
                 if (page_num + 1) % 20 == 0:
-                    logger.debug(f"Processando imagens: página {page_num + 1}/{total_pages}")
+                    logger.debug("Processando imagens: página %s/%s", page_num + 1, total_pages)
                 
                 for img_index, img_info in enumerate(image_list):
                     try:
                         xref = img_info[0]
-                        base_image = self.doc.extract_image(xref)
-                        image_bytes = base_image["image"]
-                        image_ext = base_image["ext"]
-                        image_width = base_image.get("width", 0)
-                        image_height = base_image.get("height", 0)
-                        
+
+                        # As dimensões já vêm na tupla de get_images: o
+                        # filtro de tamanho roda antes de extract_image,
+                        # sem materializar os bytes das imagens ignoradas
+                        image_width = img_info[2]
+                        image_height = img_info[3]
+
                         if image_width < min_size and image_height < min_size:
                             skipped_small += 1
-                            logger.debug(f"Imagem muito pequena ignorada: {image_width}x{image_height}px")
+                            logger.debug("Imagem muito pequena ignorada: %sx%spx", image_width, image_height)
                             continue
-                        
+
+                        base_image = self.doc.extract_image(xref)
+                        image_bytes = base_image["image"]
+                        image_ext = base_image["ext"]
+
                         base_name = f"page{page_num + 1}_img{img_index + 1}"
-                        filename = get_unique_filename(output_path, base_name, image_ext)
+                        filename = get_unique_filename(output_path, base_name, image_ext,
+                                                       existing=existing_names)
                         image_path = output_path / filename
-                        
-                        with open(image_path, "wb") as img_file:
-                            img_file.write(image_bytes)
-                        
-                        extracted_images.append(str(image_path))
-                        image_counter += 1
-                        logger.debug(f"Imagem extraída: {filename} ({image_width}x{image_height}px, {image_ext})")
-                        
+
+                        pending_writes.append((
+                            executor.submit(image_path.write_bytes, image_bytes),
+                            str(image_path)
+                        ))
+                        logger.debug("Imagem extraída: %s (%sx%spx, %s)", filename, image_width, image_height, image_ext)
+
                     except MemoryError:
-                        logger.error(f"Memória insuficiente ao extrair imagem {img_index + 1} da página {page_num + 1}")
-                        continue
-                    except (IOError, OSError) as error:
-                        logger.warning(f"Erro de I/O ao salvar imagem {img_index + 1}: {error}")
+                        logger.error("Memória insuficiente ao extrair imagem %s da página %s", img_index + 1, page_num + 1)
                         continue
                     except Exception as error:
-                        logger.warning(f"Erro ao extrair imagem {img_index + 1} da página {page_num + 1}: {error}")
+                        logger.warning("Erro ao extrair imagem %s da página %s: %s", img_index + 1, page_num + 1, error)
                         continue
-                        
+
             except Exception as error:
-                logger.warning(f"Erro ao processar página {page_num + 1} para imagens: {error}")
+                logger.warning("Erro ao processar página %s para imagens: %s", page_num + 1, error)
                 continue
-        
-        logger.info(f"Total de imagens extraídas: {image_counter} (ignoradas {skipped_small} muito pequenas)")
+
+        # Aguarda as gravações mantendo a ordem de descoberta das imagens
+        for future, image_path_str in pending_writes:
+            try:
+                future.result()
+                extracted_images.append(image_path_str)
+                image_counter += 1
+            except (IOError, OSError) as error:
+                logger.warning("Erro de I/O ao salvar imagem %s: %s", image_path_str, error)
+            except Exception as error:
+                logger.warning("Erro ao salvar imagem %s: %s", image_path_str, error)
+        executor.shutdown(wait=True)
+
+        logger.info("Total de imagens extraídas: %s (ignoradas %s muito pequenas)", image_counter, skipped_small)
         return extracted_images
     
     def count_images(self) -> int:
-        total = 0
-        for page_num in range(len(self.doc)):
-            page = self.doc[page_num]
-            total += len(page.get_images())
-        return total
+        return sum(len(page.get_images()) for page in self.doc)
     
     def close(self) -> None:
         if self.doc:
             self.doc.close()
             logger.info("PDF fechado (extração de imagens)")
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
     
     def __enter__(self) -> 'ImageExtractor':
         return self
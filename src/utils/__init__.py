@@ -4,7 +4,11 @@ from .text import (
     count_words,
     get_vocabulary_size,
     get_most_common_words,
-    split_into_chunks
+    get_most_common_words_batch,
+    get_word_statistics,
+    split_into_chunks,
+    split_into_chunks_iter,
+    split_stream_into_chunks
 )
 from .files import (
     ensure_directory,
@@ -12,6 +16,11 @@ from .files import (
     get_unique_filename,
     format_bytes
 )
+from .cache import (
+    make_cache_key,
+    cache_get,
+    cache_put
+)
 
 __all__ = [
     'clean_text',
@@ -19,9 +28,16 @@ __all__ = [
     'count_words',
     'get_vocabulary_size',
     'get_most_common_words',
+    'get_most_common_words_batch',
+    'get_word_statistics',
     'split_into_chunks',
+    'split_into_chunks_iter',
+    'split_stream_into_chunks',
     'ensure_directory',
     'get_file_size',
     'get_unique_filename',
-    'format_bytes'
+    'format_bytes',
+    'make_cache_key',
+    'cache_get',
+    'cache_put'
 ]
@@ -0,0 +1,76 @@
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+from .files import ensure_directory
+
+logger = logging.getLogger(__name__)
+
+# Versão do formato de cache: invalida entradas antigas quando a análise muda
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path('outputs/.cache')
+
+
+def make_cache_key(file_path: str, *extra: Any) -> str:
+    """Gera chave de cache estável para um arquivo e parâmetros de análise.
+
+    A chave combina caminho absoluto, mtime e tamanho do arquivo com os
+    parâmetros extras, de modo que qualquer mudança no PDF ou na
+    configuração invalida a entrada.
+
+    Args:
+        file_path: Caminho do arquivo analisado
+        *extra: Parâmetros adicionais que afetam o resultado
+
+    Returns:
+        Digest hexadecimal usável como nome de arquivo
+    """
+    stat = os.stat(file_path)
+    raw = repr((os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, CACHE_VERSION, extra))
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def cache_get(key: str, cache_dir: Path = DEFAULT_CACHE_DIR) -> Optional[Any]:
+    """Recupera um valor do cache em disco.
+
+    Args:
+        key: Chave gerada por make_cache_key
+        cache_dir: Diretório onde o cache é armazenado
+
+    Returns:
+        Valor armazenado ou None se não houver entrada válida
+    """
+    cache_file = cache_dir / f"{key}.pkl"
+
+    try:
+        with open(cache_file, 'rb') as handle:
+            value = pickle.load(handle)
+        logger.info(f"Cache hit: {cache_file.name}")
+        return value
+    except FileNotFoundError:
+        return None
+    except Exception as error:
+        logger.warning(f"Entrada de cache inválida ignorada ({cache_file.name}): {error}")
+        return None
+
+
+def cache_put(key: str, value: Any, cache_dir: Path = DEFAULT_CACHE_DIR) -> None:
+    """Armazena um valor no cache em disco.
+
+    Args:
+        key: Chave gerada por make_cache_key
+        value: Valor serializável com pickle
+        cache_dir: Diretório onde o cache é armazenado
+    """
+    try:
+        ensure_directory(str(cache_dir))
+        cache_file = cache_dir / f"{key}.pkl"
+        with open(cache_file, 'wb') as handle:
+            pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        logger.debug(f"Cache gravado: {cache_file.name}")
+    except Exception as error:
+        logger.warning(f"Não foi possível gravar cache: {error}")
@@ -1,14 +1,18 @@
 import os
 import logging
 from pathlib import Path
+from typing import Optional, Set
 
 logger = logging.getLogger(__name__)
 
 
 def ensure_directory(path: str) -> Path:
     directory = Path(path)
-    directory.mkdir(parents=True, exist_ok=True)
-    logger.info(f"Diretório garantido: {directory}")
+    # Em execuções repetidas o diretório normalmente já existe: um is_dir
+    # resolve sem entrar no caminho do mkdir
+    if not directory.is_dir():
+        directory.mkdir(parents=True, exist_ok=True)
+    logger.info("Diretório garantido: %s", directory)
     return directory
 
 
@@ -16,23 +20,52 @@ def get_file_size(file_path: str) -> int:
     return os.path.getsize(file_path)
 
 
-def get_unique_filename(directory: Path, base_name: str, extension: str) -> str:
+def get_unique_filename(directory: Path, base_name: str, extension: str,
+                        existing: Optional[Set[str]] = None) -> str:
+    """Gera um nome de arquivo que não colide com os já presentes no diretório.
+
+    Args:
+        directory: Diretório de destino
+        base_name: Nome base do arquivo (sem extensão)
+        extension: Extensão, com ou sem ponto
+        existing: Conjunto de nomes já ocupados; quando fornecido, a checagem
+            usa lookups O(1) nele (sem stat por tentativa) e o nome escolhido
+            é adicionado ao conjunto
+
+    Returns:
+        Nome de arquivo livre no diretório
+    """
     if not extension.startswith('.'):
         extension = f'.{extension}'
-    
+
     filename = f"{base_name}{extension}"
     counter = 1
-    
+
+    if existing is not None:
+        while filename in existing:
+            filename = f"{base_name}_{counter}{extension}"
+            counter += 1
+        existing.add(filename)
+        return filename
+
     while (directory / filename).exists():
         filename = f"{base_name}_{counter}{extension}"
         counter += 1
-    
+
     return filename
 
 
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 def format_bytes(size: int) -> str:
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024.0:
-            return f"{size:.2f} {unit}"
-        size /= 1024.0
-    return f"{size:.2f} PB"
+    """Formata um tamanho em bytes na unidade legível adequada.
+
+    O índice da unidade sai direto de bit_length (1024^i cabe em 10*i
+    bits), sem o laço de divisões por 1024.
+    """
+    if size < 1024:
+        return f"{size} bytes"
+
+    index = min((size.bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{size / (1 << (index * 10)):.2f} {_UNITS[index]}"
@@ -1,18 +1,75 @@
 import re
+import sys
 import unicodedata
+from bisect import bisect_right
 from collections import Counter
-from typing import List, Tuple, Set
-import nltk
-from nltk.corpus import stopwords
+from functools import lru_cache
+from itertools import accumulate
+from typing import FrozenSet, Iterable, Iterator, List, Tuple
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords', quiet=True)
 
+def _ensure_stopwords() -> None:
+    """Garante que o corpus de stopwords do NLTK está disponível localmente."""
+    import nltk
 
-def get_portuguese_stopwords() -> Set[str]:
-    return set(stopwords.words('portuguese'))
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords', quiet=True)
+
+
+@lru_cache(maxsize=1)
+def get_portuguese_stopwords() -> FrozenSet[str]:
+    # Importação e checagem do corpus adiadas para o primeiro uso: quem só
+    # tokeniza (ou roda com --no-structure) não paga o import do NLTK nem a
+    # consulta ao corpus no startup. O lru_cache constrói o frozenset uma
+    # única vez por processo
+    _ensure_stopwords()
+    from nltk.corpus import stopwords
+
+    return frozenset(stopwords.words('portuguese'))
+
+
+@lru_cache(maxsize=1)
+def _get_stopword_signatures() -> FrozenSet[Tuple[int, str]]:
+    # Pré-filtro por (comprimento, primeira letra): são ~60 assinaturas
+    # distintas entre as ~200 stopwords, então a maioria das palavras de
+    # conteúdo é descartada nesse probe pequeno sem hash no set completo
+    return frozenset((len(word), word[0]) for word in get_portuguese_stopwords())
+
+
+# Regexes de limpeza compiladas uma única vez na importação: clean_text é
+# chamada sobre o texto completo do PDF, então o custo de recompilar (e o
+# lookup no cache interno do re) por chamada não é desprezível
+_HYPHEN_NL_RE = re.compile(r'(\w+)-\s*\n\s*(\w+)')
+# Alternação única para pontuação e dígitos: o grupo distingue qual lado
+# casou (dígitos somem, pontuação vira espaço) numa só varredura do texto
+_PUNCT_DIGITS_RE = re.compile(r'(\d+)|[^\w\s.,;:!?\-]')
+
+
+def _punct_digit_repl(match: 're.Match') -> str:
+    return '' if match.group(1) else ' '
+
+
+def _build_ascii_clean_table() -> dict:
+    """Tabela de translate equivalente ao _PUNCT_DIGITS_RE para ASCII."""
+    table = {}
+    for code in range(128):
+        char = chr(code)
+        if char.isdigit():
+            table[code] = None
+        elif not (char.isalpha() or char == '_' or char.isspace() or char in '.,;:!?-'):
+            table[code] = ' '
+    return table
+
+
+_ASCII_CLEAN_TABLE = _build_ascii_clean_table()
+
+# Complementos dos padrões de separadores usados historicamente em
+# tokenize: casar as palavras diretamente (finditer) dispensa o sub que
+# copiava o texto inteiro e o split que o copiava de novo
+_WORD_RE = re.compile(r'[A-Za-zÀ-ÖØ-öø-ÿ]+')
+_WORD_NUM_RE = re.compile(r'[0-9A-Za-zÀ-ÖØ-öø-ÿ]+')
 
 
 def normalize_unicode(text: str) -> str:
@@ -21,12 +78,20 @@ def normalize_unicode(text: str) -> str:
     NFC compõe caracteres acentuados em uma única unidade (ex: á = U+00E1),
     evitando que palavras como 'vocabulário' sejam quebradas em tokens.
     """
+    # Strings ASCII são invariantes sob qualquer forma de normalização;
+    # o isascii é uma flag em C, bem mais barato que a decomposição
+    if text.isascii():
+        return text
     return unicodedata.normalize('NFC', text)
 
 
 def remove_line_breaks_hyphens(text: str) -> str:
     """Remove hífens de quebra de linha (ex: 'desenvolvi-\nmento' -> 'desenvolvimento')."""
-    return re.sub(r'(\w+)-\s*\n\s*(\w+)', r'\1\2', text)
+    # O padrão exige um '-' e um '\n' literais: dois scans de substring em
+    # C descartam a maioria dos textos sem entrar no motor de regex
+    if '\n' not in text or '-' not in text:
+        return text
+    return _HYPHEN_NL_RE.sub(r'\1\2', text)
 
 
 def clean_text(text: str, advanced: bool = True) -> str:
@@ -43,110 +108,277 @@ def clean_text(text: str, advanced: bool = True) -> str:
         text = normalize_unicode(text)
         text = remove_line_breaks_hyphens(text)
     
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'[^\w\s.,;:!?\-]', ' ', text)
-    text = re.sub(r'\d+', '', text)
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text.strip()
+    # Pontuação e dígitos saem numa única passada — via translate (uma
+    # varredura em C, sem motor de regex) quando o texto é ASCII, via
+    # regex no caso geral. split/join colapsa os espaços e cobre o strip
+    if text.isascii():
+        text = text.translate(_ASCII_CLEAN_TABLE)
+    else:
+        text = _PUNCT_DIGITS_RE.sub(_punct_digit_repl, text)
+    return ' '.join(text.split())
 
 
 def remove_accents(text: str) -> str:
     """Remove acentos do texto mantendo caracteres base."""
+    if text.isascii():
+        return text
     nfkd_form = unicodedata.normalize('NFD', text)
-    return ''.join([char for char in nfkd_form if not unicodedata.combining(char)])
+    combining = unicodedata.combining
+    return ''.join([char for char in nfkd_form if not combining(char)])
+
+
+# Strings curtas (cabeçalhos, rodapés, títulos repetidos) passam por um
+# cache; textos de documento inteiros ficariam presos na memória do LRU
+_TOKENIZE_CACHE_MAX_CHARS = 256
+
+
+def _iter_tokens(text: str, keep_numbers: bool, advanced_clean: bool) -> Iterator[str]:
+    """Gera os tokens sob demanda, sem materializar a lista completa."""
+    if advanced_clean:
+        text = normalize_unicode(text)
+        text = remove_line_breaks_hyphens(text)
+
+    word_re = _WORD_NUM_RE if keep_numbers else _WORD_RE
+    return (match.group() for match in word_re.finditer(text.lower()))
+
+
+def _tokenize_uncached(text: str, keep_numbers: bool, advanced_clean: bool) -> List[str]:
+    if advanced_clean:
+        text = normalize_unicode(text)
+        text = remove_line_breaks_hyphens(text)
+
+    # lower no texto inteiro (uma chamada em C) no lugar de um .lower por
+    # token, e findall devolve as strings direto, sem objetos Match. As
+    # classes de caracteres são estáveis sob lower para o latim-1.
+    # O intern faz ocorrências repetidas da mesma palavra compartilharem
+    # um único objeto: a lista de tokens de um documento grande encolhe
+    # para o tamanho do vocabulário, e o Counter resolve a igualdade por
+    # identidade em vez de comparar caracteres
+    word_re = _WORD_NUM_RE if keep_numbers else _WORD_RE
+    return list(map(sys.intern, word_re.findall(text.lower())))
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_cached(text: str, keep_numbers: bool, advanced_clean: bool) -> Tuple[str, ...]:
+    return tuple(_tokenize_uncached(text, keep_numbers, advanced_clean))
 
 
 def tokenize(text: str, keep_numbers: bool = False, advanced_clean: bool = True) -> List[str]:
     """Tokeniza texto em palavras individuais com contagem precisa.
-    
+
     Args:
         text: Texto a ser tokenizado
         keep_numbers: Se True, mantém dígitos como palavras válidas
         advanced_clean: Se True, aplica normalização Unicode e remove hífens de quebra
-    
+
     Returns:
         Lista de tokens em minúsculas
     """
-    if advanced_clean:
-        text = normalize_unicode(text)
-        text = remove_line_breaks_hyphens(text)
-    
-    if keep_numbers:
-        pattern = r'[^0-9A-Za-zÀ-ÖØ-öø-ÿ]+'
-    else:
-        pattern = r'[^A-Za-zÀ-ÖØ-öø-ÿ]+'
-    
-    text = re.sub(pattern, ' ', text)
-    return [word.lower() for word in text.split() if word]
+    if len(text) <= _TOKENIZE_CACHE_MAX_CHARS:
+        return list(_tokenize_cached(text, keep_numbers, advanced_clean))
+    return _tokenize_uncached(text, keep_numbers, advanced_clean)
 
 
-def count_words(text: str, keep_numbers: bool = False) -> int:
+def count_words(text: str, keep_numbers: bool = False, advanced_clean: bool = True) -> int:
     """Conta palavras no texto.
-    
+
     Args:
         text: Texto a contar
         keep_numbers: Se True, números são contados como palavras
-    
+        advanced_clean: Se False, assume texto já normalizado
+
     Returns:
         Número total de palavras
     """
-    return len(tokenize(text, keep_numbers=keep_numbers))
+    if advanced_clean:
+        text = normalize_unicode(text)
+        text = remove_line_breaks_hyphens(text)
 
+    # Só o total interessa: conta as ocorrências sem construir a lista
+    word_re = _WORD_NUM_RE if keep_numbers else _WORD_RE
+    return sum(1 for _ in word_re.finditer(text))
 
-def get_vocabulary_size(text: str, keep_numbers: bool = False) -> int:
+
+def get_vocabulary_size(text: str, keep_numbers: bool = False, advanced_clean: bool = True) -> int:
     """Calcula tamanho do vocabulário (palavras únicas).
-    
+
     Args:
         text: Texto a analisar
         keep_numbers: Se True, números são incluídos no vocabulário
-    
+        advanced_clean: Se False, assume texto já normalizado
+
     Returns:
         Número de palavras distintas
     """
-    tokens = tokenize(text, keep_numbers=keep_numbers)
-    return len(set(tokens))
+    # O set consome os tokens direto do gerador: sem a lista intermediária
+    return len(set(_iter_tokens(text, keep_numbers, advanced_clean)))
 
 
-def get_most_common_words(text: str, n: int = 10, remove_stopwords: bool = True, keep_numbers: bool = False) -> List[Tuple[str, int]]:
+def get_most_common_words(text: str, n: int = 10, remove_stopwords: bool = True, keep_numbers: bool = False, advanced_clean: bool = True) -> List[Tuple[str, int]]:
     """Retorna as N palavras mais comuns do texto.
-    
+
     Args:
         text: Texto a analisar
         n: Número de palavras mais comuns a retornar
         remove_stopwords: Se True, remove palavras comuns do português
         keep_numbers: Se True, inclui números na contagem
-    
+        advanced_clean: Se False, assume texto já normalizado
+
     Returns:
         Lista de tuplas (palavra, frequência) ordenada por frequência
     """
-    tokens = tokenize(text, keep_numbers=keep_numbers)
-    
+    tokens = tokenize(text, keep_numbers=keep_numbers, advanced_clean=advanced_clean)
+
     if remove_stopwords:
+        # Filtro inline alimentando o Counter: evita materializar uma
+        # segunda lista completa de tokens só para descartar stopwords
         stop_words = get_portuguese_stopwords()
-        tokens = [word for word in tokens if word not in stop_words and len(word) > 2]
-    
-    counter = Counter(tokens)
+        stop_signatures = _get_stopword_signatures()
+        counter = Counter(
+            word for word in tokens
+            if len(word) > 2 and ((len(word), word[0]) not in stop_signatures or word not in stop_words)
+        )
+    else:
+        counter = Counter(tokens)
+
     return counter.most_common(n)
 
 
-def split_into_chunks(text: str, max_length: int = 1024) -> List[str]:
+def get_most_common_words_batch(docs: Iterable[str], n: int = 10, remove_stopwords: bool = True, keep_numbers: bool = False) -> List[List[Tuple[str, int]]]:
+    """Calcula as N palavras mais comuns de cada documento de um lote.
+
+    Equivale a chamar get_most_common_words por documento, mas resolve o
+    conjunto de stopwords e o pré-filtro de comprimentos uma única vez
+    para o lote inteiro.
+
+    Args:
+        docs: Iterável de textos de documentos
+        n: Número de palavras mais comuns por documento
+        remove_stopwords: Se True, remove palavras comuns do português
+        keep_numbers: Se True, inclui números na contagem
+
+    Returns:
+        Lista com as (palavra, frequência) mais comuns de cada documento,
+        na ordem dos documentos de entrada
+    """
+    if remove_stopwords:
+        stop_words = get_portuguese_stopwords()
+        stop_signatures = _get_stopword_signatures()
+
+    results = []
+    for doc in docs:
+        tokens = tokenize(doc, keep_numbers=keep_numbers)
+        if remove_stopwords:
+            counter = Counter(
+                word for word in tokens
+                if len(word) > 2 and ((len(word), word[0]) not in stop_signatures or word not in stop_words)
+            )
+        else:
+            counter = Counter(tokens)
+        results.append(counter.most_common(n))
+
+    return results
+
+
+def get_word_statistics(text: str, n: int = 10, keep_numbers: bool = False, remove_stopwords: bool = True, advanced_clean: bool = True) -> Tuple[int, int, List[Tuple[str, int]]]:
+    """Calcula contagem, vocabulário e palavras mais comuns em uma única passada.
+
+    Equivale a chamar count_words, get_vocabulary_size e
+    get_most_common_words, mas tokeniza o texto uma única vez; o filtro de
+    stopwords é aplicado sobre o Counter (tamanho do vocabulário), não
+    sobre a lista completa de tokens.
+
+    Args:
+        text: Texto a analisar
+        n: Número de palavras mais comuns a retornar
+        keep_numbers: Se True, números são contados como palavras
+        remove_stopwords: Se True, remove stopwords das mais comuns
+        advanced_clean: Se False, assume texto já normalizado
+
+    Returns:
+        Tupla (total de palavras, tamanho do vocabulário, mais comuns)
+    """
+    tokens = tokenize(text, keep_numbers=keep_numbers, advanced_clean=advanced_clean)
+    counter = Counter(tokens)
+    word_count = len(tokens)
+    vocabulary_size = len(counter)
+
+    if remove_stopwords:
+        stop_words = get_portuguese_stopwords()
+        stop_signatures = _get_stopword_signatures()
+        filtered = Counter({
+            word: count for word, count in counter.items()
+            if len(word) > 2 and ((len(word), word[0]) not in stop_signatures or word not in stop_words)
+        })
+        most_common = filtered.most_common(n)
+    else:
+        most_common = counter.most_common(n)
+
+    return word_count, vocabulary_size, most_common
+
+
+def split_into_chunks_iter(text: str, max_length: int = 1024) -> Iterator[str]:
+    """Gera chunks de texto sob demanda, sem materializar a lista completa.
+
+    Args:
+        text: Texto a dividir
+        max_length: Tamanho máximo aproximado de cada chunk em caracteres
+
+    Yields:
+        Chunks de texto com até max_length caracteres
+    """
+    # Somas acumuladas dos comprimentos: cada corte vira uma busca binária
+    # sobre elas, avançando chunks inteiros por iteração em vez de uma
+    # palavra por passo do interpretador
     words = text.split()
-    chunks = []
+    total = len(words)
+    if not total:
+        return
+
+    cumulative = list(accumulate(len(word) + 1 for word in words))
+    start = 0
+    base = 0
+
+    while start < total:
+        end = bisect_right(cumulative, base + max_length, lo=start)
+        if end == start:
+            # Palavra isolada maior que max_length forma um chunk sozinha
+            end = start + 1
+        yield ' '.join(words[start:end])
+        base = cumulative[end - 1]
+        start = end
+
+
+def split_stream_into_chunks(pieces: Iterable[str], max_length: int = 1024) -> Iterator[str]:
+    """Gera chunks a partir de um fluxo de trechos de texto (ex: páginas de PDF).
+
+    Equivalente a split_into_chunks_iter sobre a concatenação dos trechos,
+    mas sem nunca montar o texto completo em memória.
+
+    Args:
+        pieces: Iterável de trechos de texto
+        max_length: Tamanho máximo aproximado de cada chunk em caracteres
+
+    Yields:
+        Chunks de texto com até max_length caracteres
+    """
     current_chunk = []
     current_length = 0
-    
-    for word in words:
-        word_length = len(word) + 1
-        if current_length + word_length > max_length and current_chunk:
-            chunks.append(' '.join(current_chunk))
-            current_chunk = [word]
-            current_length = word_length
-        else:
-            current_chunk.append(word)
-            current_length += word_length
-    
+
+    for piece in pieces:
+        for word in piece.split():
+            word_length = len(word) + 1
+            if current_length + word_length > max_length and current_chunk:
+                yield ' '.join(current_chunk)
+                current_chunk = [word]
+                current_length = word_length
+            else:
+                current_chunk.append(word)
+                current_length += word_length
+
     if current_chunk:
-        chunks.append(' '.join(current_chunk))
-    
-    return chunks
+        yield ' '.join(current_chunk)
+
+
+def split_into_chunks(text: str, max_length: int = 1024) -> List[str]:
+    return list(split_into_chunks_iter(text, max_length=max_length))
@@ -0,0 +1,56 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from src.utils.cache import make_cache_key, cache_get, cache_put
+
+
+class TestCacheUtils(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = Path(self.temp_dir) / "cache"
+        self.test_file = Path(self.temp_dir) / "documento.pdf"
+        self.test_file.write_bytes(b"conteudo de teste")
+
+    def tearDown(self):
+        if Path(self.temp_dir).exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_make_cache_key_is_stable(self):
+        key1 = make_cache_key(str(self.test_file), "text", 10)
+        key2 = make_cache_key(str(self.test_file), "text", 10)
+        self.assertEqual(key1, key2)
+
+    def test_make_cache_key_changes_with_params(self):
+        key1 = make_cache_key(str(self.test_file), "text", 10)
+        key2 = make_cache_key(str(self.test_file), "pdf", 10)
+        self.assertNotEqual(key1, key2)
+
+    def test_make_cache_key_changes_with_content(self):
+        key1 = make_cache_key(str(self.test_file))
+        self.test_file.write_bytes(b"conteudo diferente e maior")
+        key2 = make_cache_key(str(self.test_file))
+        self.assertNotEqual(key1, key2)
+
+    def test_cache_get_missing_returns_none(self):
+        result = cache_get("chave_inexistente", cache_dir=self.cache_dir)
+        self.assertIsNone(result)
+
+    def test_cache_put_and_get_roundtrip(self):
+        value = {"word_count": 42, "titles": ["Introdução"]}
+        key = make_cache_key(str(self.test_file))
+        cache_put(key, value, cache_dir=self.cache_dir)
+        result = cache_get(key, cache_dir=self.cache_dir)
+        self.assertEqual(result, value)
+
+    def test_cache_get_corrupted_entry_returns_none(self):
+        key = "entrada_corrompida"
+        self.cache_dir.mkdir(parents=True)
+        (self.cache_dir / f"{key}.pkl").write_bytes(b"nao e pickle")
+        result = cache_get(key, cache_dir=self.cache_dir)
+        self.assertIsNone(result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,9 +5,12 @@ from src.utils.text import (
     count_words,
     get_vocabulary_size,
     get_most_common_words,
+    get_most_common_words_batch,
     remove_accents,
     normalize_unicode,
-    split_into_chunks
+    split_into_chunks,
+    split_stream_into_chunks,
+    get_word_statistics
 )
 
 
@@ -66,6 +69,15 @@ class TestTextUtils(unittest.TestCase):
         self.assertEqual(common[0][0], "java")
         self.assertEqual(common[0][1], 3)
     
+    def test_get_most_common_words_batch(self):
+        docs = ["python python java", "java java java c"]
+        batch = get_most_common_words_batch(docs, n=1, remove_stopwords=False)
+        expected = [
+            get_most_common_words(doc, n=1, remove_stopwords=False)
+            for doc in docs
+        ]
+        self.assertEqual(batch, expected)
+
     def test_remove_accents(self):
         text = "São Paulo, José, Ação"
         result = remove_accents(text)
@@ -83,6 +95,24 @@ class TestTextUtils(unittest.TestCase):
         for chunk in chunks:
             self.assertLessEqual(len(chunk), 60)
 
+    def test_get_word_statistics_matches_individual_functions(self):
+        text = "análise de dados com análise de texto em python"
+        word_count, vocabulary_size, most_common = get_word_statistics(
+            text, n=3, remove_stopwords=False
+        )
+        self.assertEqual(word_count, count_words(text))
+        self.assertEqual(vocabulary_size, get_vocabulary_size(text))
+        self.assertEqual(
+            most_common,
+            get_most_common_words(text, n=3, remove_stopwords=False)
+        )
+
+    def test_split_stream_into_chunks_matches_in_memory(self):
+        pages = [" ".join(["palavra"] * 25) for _ in range(4)]
+        streamed = list(split_stream_into_chunks(iter(pages), max_length=50))
+        in_memory = split_into_chunks(" ".join(pages), max_length=50)
+        self.assertEqual(streamed, in_memory)
+
 
 if __name__ == '__main__':
     unittest.main()